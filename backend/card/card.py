@@ -1,5 +1,5 @@
 # 牌模块
-from typing import List, Union
+from typing import List, Optional, Union
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -7,6 +7,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 from backend.utils.logger import game_logger
 from config.enums import CardSuit, CardType, EquipmentType, CardName, TargetType
 from config.card_properties import get_card_properties
+from config.simple_card_config import SimpleCardConfig
 
 
 class Card:
@@ -36,6 +37,9 @@ class Card:
         
         # 视为属性，初始化时与牌名一致
         self.regarded_as = self.name  # 当前被视为的牌名
+
+        # 发往前端的 SimpleCardConfig 缓存，由 event_sender.card_to_simple_config 首次转换时填充
+        self._simple_config: Optional[SimpleCardConfig] = None
     
     def __str__(self) -> str:
         """字符串表示"""
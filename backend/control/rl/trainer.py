@@ -3,6 +3,7 @@ from __future__ import annotations
 import argparse
 import os
 import random
+from dataclasses import replace
 from typing import Dict, List, Optional
 
 from config.enums import ControlType, PlayerIdentity
@@ -40,8 +41,8 @@ def _set_rl_players(config, rl_player_ids: List[int]) -> None:
     for i, p in enumerate(config.players_config):
         if i in rl_player_ids:
             # 训练时统一使用 AI.EXPERT（内部委托 ExpertAIControl）
-            p.control_type = ControlType.AI
-            setattr(p, "ai_difficulty", "expert")
+            # SimplePlayerConfig 是不可变的，替换为新实例
+            config.players_config[i] = replace(p, control_type=ControlType.AI, ai_difficulty="expert")
 
 
 def _collect_rl_controls(game: GameController) -> Dict[int, ExpertAIControl]:
@@ -1,8 +1,5 @@
 # 玩家工厂模块
 from typing import Optional
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from backend.player.player import (Player, ZhangFeiPlayer, LvMengPlayer, LingCaoPlayer, ZhuguoShaPlayer,
                                    ZhouYuPlayer,SunQuanPlayer,HuangGaiPlayer)
@@ -10,6 +7,19 @@ from backend.deck.deck import Deck
 from config.enums import ControlType, PlayerIdentity, CharacterName
 
 
+# 武将名 -> 玩家子类
+_CHARACTER_PLAYER_CLASSES = {
+    CharacterName.ZHANG_FEI: ZhangFeiPlayer,
+    CharacterName.LV_MENG: LvMengPlayer,
+    CharacterName.LING_CAO: LingCaoPlayer,
+    CharacterName.ZHU_GUO_SHA: ZhuguoShaPlayer,
+    CharacterName.CAO_CAO: ZhuguoShaPlayer,
+    CharacterName.SUN_QUAN: SunQuanPlayer,
+    CharacterName.HUANG_GAI: HuangGaiPlayer,
+    CharacterName.ZHOU_YU: ZhouYuPlayer,
+}
+
+
 class PlayerFactory:
     """玩家工厂类
     
@@ -42,105 +52,15 @@ class PlayerFactory:
         Returns:
             玩家实例（max_hp 默认为 4）
         """
-        # 根据武将名创建对应的玩家子类
-        if character_name == CharacterName.ZHANG_FEI:
-            return ZhangFeiPlayer(
-                player_id=player_id,
-                name=name,
-                control_type=control_type,
-                ai_difficulty=ai_difficulty,
-                deck=deck,
-                identity=identity,
-                character_name=character_name,
-                player_controller=player_controller
-            )
-        elif character_name == CharacterName.LV_MENG:
-            return LvMengPlayer(
-                player_id=player_id,
-                name=name,
-                control_type=control_type,
-                ai_difficulty=ai_difficulty,
-                deck=deck,
-                identity=identity,
-                character_name=character_name,
-                player_controller=player_controller
-            )
-        elif character_name == CharacterName.LING_CAO:
-            return LingCaoPlayer(
-                player_id=player_id,
-                name=name,
-                control_type=control_type,
-                ai_difficulty=ai_difficulty,
-                deck=deck,
-                identity=identity,
-                character_name=character_name,
-                player_controller=player_controller
-            )
-        elif character_name == CharacterName.ZHU_GUO_SHA:
-            return ZhuguoShaPlayer(
-                player_id=player_id,
-                name=name,
-                control_type=control_type,
-                ai_difficulty=ai_difficulty,
-                deck=deck,
-                identity=identity,
-                character_name=character_name,
-                player_controller=player_controller
-            )
-        elif character_name == CharacterName.CAO_CAO:
-            return ZhuguoShaPlayer(
-                player_id=player_id,
-                name=name,
-                control_type=control_type,
-                ai_difficulty=ai_difficulty,
-                deck=deck,
-                identity=identity,
-                character_name=character_name,
-                player_controller=player_controller
-            )
-        elif character_name == CharacterName.SUN_QUAN:
-            return SunQuanPlayer(
-                player_id=player_id,
-                name=name,
-                control_type=control_type,
-                ai_difficulty=ai_difficulty,
-                deck=deck,
-                identity=identity,
-                character_name=character_name,
-                player_controller=player_controller
-            )
-        elif character_name == CharacterName.HUANG_GAI:
-            return HuangGaiPlayer(
-                player_id=player_id,
-                name=name,
-                control_type=control_type,
-                ai_difficulty=ai_difficulty,
-                deck=deck,
-                identity=identity,
-                character_name=character_name,
-                player_controller=player_controller
-            )
-        elif character_name == CharacterName.ZHOU_YU:
-            return ZhouYuPlayer(
-                player_id=player_id,
-                name=name,
-                control_type=control_type,
-                ai_difficulty=ai_difficulty,
-                deck=deck,
-                identity=identity,
-                character_name=character_name,
-                player_controller=player_controller
-            )
-        else:
-            # 默认创建白板武将（Player基类）
-            return Player(
-                player_id=player_id,
-                name=name,
-                control_type=control_type,
-                ai_difficulty=ai_difficulty,
-                deck=deck,
-                identity=identity,
-                character_name=character_name,
-                player_controller=player_controller
-            )
-
+        # 根据武将名选择对应的玩家子类，未登记的武将默认为白板武将（Player基类）
+        player_cls = _CHARACTER_PLAYER_CLASSES.get(character_name, Player)
+        return player_cls(
+            player_id=player_id,
+            name=name,
+            control_type=control_type,
+            ai_difficulty=ai_difficulty,
+            deck=deck,
+            identity=identity,
+            character_name=character_name,
+            player_controller=player_controller
+        )
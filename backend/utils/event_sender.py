@@ -1,15 +1,12 @@
 # 事件发送工具模块
 """后端向前端发送事件的工具函数"""
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from typing import Callable, List
 
 from backend.card.card import Card
 from communicator.communicator import communicator
-from communicator.comm_event import DrawCardEvent, PlayCardEvent, HPChangeEvent, DiscardCardEvent, EquipChangeEvent, DeathEvent
+from communicator.comm_event import CommEvent, DrawCardEvent, PlayCardEvent, HPChangeEvent, DiscardCardEvent, EquipChangeEvent, DeathEvent
 from config.simple_card_config import SimpleCardConfig
 from config.enums import CardName, EquipmentType
-from communicator.communicator import communicator
 
 
 def has_communicator() -> bool:
@@ -77,45 +74,71 @@ def card_to_simple_config(card: Card) -> SimpleCardConfig:
         
     Returns:
         SimpleCardConfig对象
+
+    Note:
+        Card 的牌名/花色/点数在创建后不会变化，因此转换结果缓存在 card._simple_config 上，
+        同一张牌多次摸/出/弃时复用同一个 SimpleCardConfig。
     """
-    return SimpleCardConfig(
-        name=card.name_enum,
-        suit=card.suit,
-        rank=card.rank
-    )
+    card_config = card._simple_config
+    if card_config is None:
+        card_config = SimpleCardConfig(
+            name=card.name_enum,
+            suit=card.suit,
+            rank=card.rank
+        )
+        card._simple_config = card_config
+    return card_config
 
 
-def send_draw_card_event(card: Card, to_player_id: int) -> tuple:
-    """发送摸牌事件到前端
+def _dispatch(build_events: Callable[[], List[CommEvent]]) -> tuple:
+    """构造事件、发往前端并通知ControlManager
+
+    多个事件时一次性批量发送并等待全部ACK，ControlManager只通知第一个事件
+    （所有Control都能看到同一条广播）。事件构造也放在异常保护内，
+    转换牌配置等步骤出错同样不影响游戏逻辑。
 
     Args:
-        card: 摸到的牌
-        to_player_id: 接收牌的玩家ID
+        build_events: 返回待发送事件列表（至少一个）的构造函数
 
     Returns:
         (success: bool, message: str) - 如果全局wait_for_ack为False，返回(None, None)
     """
+    wait_for_ack = _wait_for_ack
     try:
-        event = None
-        if communicator:
-            card_config = card_to_simple_config(card)
-            event = DrawCardEvent(card_config, to_player_id)
-            result = communicator.send_to_frontend(event, wait_for_ack=_wait_for_ack)
-        
+        events = build_events()
+        if len(events) == 1:
+            result = communicator.send_to_frontend(events[0], wait_for_ack=wait_for_ack)
+        else:
+            result = communicator.send_many_to_frontend(list(events), wait_for_ack=wait_for_ack)
+
         # 通知ControlManager
-        if _control_manager and event:
-            _control_manager.notify_event(event)
-        
-        if communicator and event:
-            return result if _wait_for_ack else (None, None)
-        return None, None
+        control_manager = _control_manager
+        if control_manager:
+            control_manager.notify_event(events[0])
+
+        return result if wait_for_ack else (None, None)
     except Exception as e:
         # 如果通信失败，不影响游戏逻辑
-        if _wait_for_ack:
+        if wait_for_ack:
             return False, f"Communication error: {str(e)}"
         return None, None
 
 
+def send_draw_card_event(card: Card, to_player_id: int) -> tuple:
+    """发送摸牌事件到前端
+
+    Args:
+        card: 摸到的牌
+        to_player_id: 接收牌的玩家ID
+
+    Returns:
+        (success: bool, message: str) - 如果全局wait_for_ack为False，返回(None, None)
+    """
+    if not communicator:
+        return None, None
+    return _dispatch(lambda: [DrawCardEvent(card_to_simple_config(card), to_player_id)])
+
+
 def send_play_card_event(card: Card, from_player_id: int, to_player_ids: list, 
                          response_type: str = None, response_target: int = None,
                          original_card_name: str = None, is_effective: bool = None) -> tuple:
@@ -133,52 +156,36 @@ def send_play_card_event(card: Card, from_player_id: int, to_player_ids: list,
     Returns:
         (success: bool, message: str) - 如果全局wait_for_ack为False，返回(None, None)
     """
-    try:
-        events = []
-        if communicator:
-            card_config = card_to_simple_config(card)
-            # 确保to_player_ids是列表
-            if to_player_ids is None:
-                to_player_ids = []
-            # 如果没有目标且不是响应类事件，发送给自己（某些牌可能没有目标）
-            # 对于响应类事件（如响应决斗的杀、响应南蛮入侵的杀），发送给[-1]表示在中心显示
-            if not to_player_ids:
-                if response_type is None:
-                    # 非响应类事件，发送给自己
-                    to_player_ids = [from_player_id]
-                else:
-                    # 响应类事件，发送给[-1]表示在中心显示（前端会处理）
-                    to_player_ids = [-1]
-
-            # 对每个目标发送事件，只等待最后一个事件的ACK
-            success = True
-            message = ""
-            for i, to_player_id in enumerate(to_player_ids):
-                event = PlayCardEvent(
-                    card_config, from_player_id, to_player_id,
-                    response_type=response_type,
-                    response_target=response_target,
-                    original_card_name=original_card_name,
-                    is_effective=is_effective
-                )
-                events.append(event)
-                result = communicator.send_to_frontend(event, wait_for_ack=_wait_for_ack and i == len(to_player_ids) - 1)
-                if _wait_for_ack and i == len(to_player_ids) - 1:
-                    success, message = result
-
-            # 通知ControlManager（只通知一次，因为所有Control都能看到）
-            if _control_manager and events:
-                _control_manager.notify_event(events[0])
-
-            if _wait_for_ack:
-                return success, message
-            return None, None
-    except Exception as e:
-        # 如果通信失败，不影响游戏逻辑
-        if _wait_for_ack:
-            return False, f"Communication error: {str(e)}"
+    if not communicator:
         return None, None
 
+    def build_events() -> List[CommEvent]:
+        card_config = card_to_simple_config(card)
+        targets = to_player_ids
+        # 如果没有目标且不是响应类事件，发送给自己（某些牌可能没有目标）
+        # 对于响应类事件（如响应决斗的杀、响应南蛮入侵的杀），发送给[-1]表示在中心显示
+        if not targets:
+            if response_type is None:
+                # 非响应类事件，发送给自己
+                targets = [from_player_id]
+            else:
+                # 响应类事件，发送给[-1]表示在中心显示（前端会处理）
+                targets = [-1]
+
+        # 对每个目标各发送一个事件
+        return [
+            PlayCardEvent(
+                card_config, from_player_id, to_player_id,
+                response_type=response_type,
+                response_target=response_target,
+                original_card_name=original_card_name,
+                is_effective=is_effective
+            )
+            for to_player_id in targets
+        ]
+
+    return _dispatch(build_events)
+
 
 def send_hp_change_event(player_id: int, new_hp: int, source_player_id: int = None,
                          damage_type: str = None, original_card_name: str = None) -> tuple:
@@ -194,29 +201,14 @@ def send_hp_change_event(player_id: int, new_hp: int, source_player_id: int = No
     Returns:
         (success: bool, message: str) - 如果全局wait_for_ack为False，返回(None, None)
     """
-    try:
-        event = None
-        if communicator:
-            event = HPChangeEvent(
-                player_id, new_hp,
-                source_player_id=source_player_id,
-                damage_type=damage_type,
-                original_card_name=original_card_name
-            )
-            result = communicator.send_to_frontend(event, wait_for_ack=_wait_for_ack)
-        
-        # 通知ControlManager
-        if _control_manager and event:
-            _control_manager.notify_event(event)
-        
-        if communicator and event:
-            return result if _wait_for_ack else (None, None)
-        return None, None
-    except Exception as e:
-        # 如果通信失败，不影响游戏逻辑
-        if _wait_for_ack:
-            return False, f"Communication error: {str(e)}"
+    if not communicator:
         return None, None
+    return _dispatch(lambda: [HPChangeEvent(
+        player_id, new_hp,
+        source_player_id=source_player_id,
+        damage_type=damage_type,
+        original_card_name=original_card_name
+    )])
 
 
 def send_discard_card_event(card: Card, player_id: int) -> tuple:
@@ -229,25 +221,9 @@ def send_discard_card_event(card: Card, player_id: int) -> tuple:
     Returns:
         (success: bool, message: str) - 如果全局wait_for_ack为False，返回(None, None)
     """
-    try:
-        event = None
-        if communicator:
-            card_config = card_to_simple_config(card)
-            event = DiscardCardEvent(card_config, player_id)
-            result = communicator.send_to_frontend(event, wait_for_ack=_wait_for_ack)
-        
-        # 通知ControlManager
-        if _control_manager and event:
-            _control_manager.notify_event(event)
-        
-        if communicator and event:
-            return result if _wait_for_ack else (None, None)
-        return None, None
-    except Exception as e:
-        # 如果通信失败，不影响游戏逻辑
-        if _wait_for_ack:
-            return False, f"Communication error: {str(e)}"
+    if not communicator:
         return None, None
+    return _dispatch(lambda: [DiscardCardEvent(card_to_simple_config(card), player_id)])
 
 
 def _get_equipment_type(card_name: CardName) -> EquipmentType:
@@ -283,24 +259,9 @@ def send_equip_change_event(player_id: int, equip_name: CardName, equip_type: Eq
     Returns:
         (success: bool, message: str) - 如果全局wait_for_ack为False，返回(None, None)
     """
-    try:
-        event = None
-        if communicator:
-            event = EquipChangeEvent(player_id, equip_name, equip_type)
-            result = communicator.send_to_frontend(event, wait_for_ack=_wait_for_ack)
-        
-        # 通知ControlManager
-        if _control_manager and event:
-            _control_manager.notify_event(event)
-        
-        if communicator and event:
-            return result if _wait_for_ack else (None, None)
-        return None, None
-    except Exception as e:
-        # 如果通信失败，不影响游戏逻辑
-        if _wait_for_ack:
-            return False, f"Communication error: {str(e)}"
+    if not communicator:
         return None, None
+    return _dispatch(lambda: [EquipChangeEvent(player_id, equip_name, equip_type)])
 
 
 def send_death_event(player_id: int) -> tuple:
@@ -312,21 +273,6 @@ def send_death_event(player_id: int) -> tuple:
     Returns:
         (success: bool, message: str) - 如果全局wait_for_ack为False，返回(None, None)
     """
-    try:
-        event = None
-        if communicator:
-            event = DeathEvent(player_id)
-            result = communicator.send_to_frontend(event, wait_for_ack=_wait_for_ack)
-        
-        # 通知ControlManager
-        if _control_manager and event:
-            _control_manager.notify_event(event)
-        
-        if communicator and event:
-            return result if _wait_for_ack else (None, None)
-        return None, None
-    except Exception as e:
-        # 如果通信失败，不影响游戏逻辑
-        if _wait_for_ack:
-            return False, f"Communication error: {str(e)}"
+    if not communicator:
         return None, None
+    return _dispatch(lambda: [DeathEvent(player_id)])
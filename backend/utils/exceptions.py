@@ -14,13 +14,20 @@ class InvalidCardException(GameException):
     """无效的牌异常。"""
 
     def __init__(self, card: object):
-        super().__init__(f"无效的牌: {card}")
+        super().__init__(card)
         self.card = card
 
+    def __str__(self) -> str:
+        # 消息在真正需要时才格式化，捕获后直接丢弃的异常不付出 str(card) 的开销
+        return f"无效的牌: {self.card}"
+
 
 class InvalidTargetException(GameException):
     """无效的目标异常。"""
 
     def __init__(self, target_id: int):
-        super().__init__(f"无效的目标: {target_id}")
+        super().__init__(target_id)
         self.target_id = target_id
+
+    def __str__(self) -> str:
+        return f"无效的目标: {self.target_id}"
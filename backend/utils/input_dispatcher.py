@@ -9,13 +9,15 @@
 
 from __future__ import annotations
 
-import queue
 import threading
 from typing import Optional
 
 from communicator.communicator import communicator
 from communicator.comm_event import InputResponseEvent, CommEvent
 
+# stop() 投递到 ftb_queue 的唤醒标记，让阻塞在 get() 上的分发线程立即退出
+_WAKEUP = object()
+
 
 class FrontendInputDispatcher:
     """后台线程：消费前端->后端队列，并把输入事件分发给对应 Control。"""
@@ -61,20 +63,23 @@ class FrontendInputDispatcher:
             None
         """
         self._stop_event.set()
+        if self._thread is not None and self._thread.is_alive():
+            # 直接入队：send_to_backend 会读取事件的 kind，唤醒标记不是 CommEvent
+            communicator.ftb_queue.put(_WAKEUP)
         if wait and self._thread is not None:
             self._thread.join(timeout=1.0)
 
     def _run(self) -> None:
-        """线程主循环：不断从 ftb_queue 取事件并分发。"""
+        """线程主循环：阻塞等待 ftb_queue 中的事件并分发，没有输入时不占用 CPU。"""
         while not self._stop_event.is_set():
             try:
-                event: CommEvent = communicator.get_from_frontend(timeout=0.1)
-            except queue.Empty:
-                continue
+                event: CommEvent = communicator.get_from_frontend()
             except Exception:
                 continue
+            if event is _WAKEUP:
+                continue
 
-            # 只处理输入响应；AckEvent 等其他事件由 communicator 内部 ACK 线程处理或直接忽略
+            # 只处理输入响应；AckEvent 由 communicator.send_to_backend 直接处理，不会入队
             if isinstance(event, InputResponseEvent):
                 control = self.control_manager.controls.get(event.player_id)
                 if control is not None:
@@ -1,37 +1,57 @@
 # 日志系统模块
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
 from typing import Optional
-import threading
+
+
+class _Lazy:
+    """延迟求值的日志参数：只有日志真正被格式化时才调用 func(*args) 生成文本"""
+    
+    __slots__ = ('func', 'args')
+    
+    def __init__(self, func, *args):
+        self.func = func
+        self.args = args
+    
+    def __str__(self) -> str:
+        return self.func(*self.args)
+
+
+def _join_names(names: list) -> str:
+    return ', '.join(names)
+
+
+def _join_card_names(cards: list) -> str:
+    return ', '.join(card.name for card in cards)
+
+
+def _join_player_ids(player_ids: list) -> str:
+    return ', '.join(f"玩家{player_id}" for player_id in player_ids)
 
 
 class GameLogger:
     """游戏日志系统
     
-    负责管理游戏日志的创建、记录和保存
+    负责管理游戏日志的创建、记录和保存。
+    全局只使用模块级实例 game_logger，不要自行实例化。
     """
     
-    _instance = None
-    _lock = threading.Lock()
-    
-    def __new__(cls):
-        """单例模式"""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
-    
     def __init__(self):
-        if hasattr(self, '_initialized'):
-            return
-        
-        self._initialized = True
         self.logger = None
         self.log_file_path = None
         self.is_test_mode = False
+        self._log_queue = None
+        self._queue_handler = None
+        self._listener = None
+        self._last_deck_status = None  # 上次记录的 (牌堆id, 牌堆张数, 弃牌堆张数)
         self._setup_logger()
+        # 后端以守护线程运行，进程可能不经 end_game_session 就退出（崩溃/直接关窗口）：
+        # 退出时停掉后台写线程并写出 MemoryHandler 中缓冲的记录，避免丢失最后几回合的日志
+        atexit.register(self._stop_listener)
     
     def _setup_logger(self):
         """设置日志器"""
@@ -41,6 +61,10 @@ class GameLogger:
         # 清除已有的处理器
         for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
+        
+        # 游戏线程只把日志记录放入队列，文件写入由 QueueListener 的后台线程完成
+        self._log_queue = queue.Queue(-1)
+        self._queue_handler = logging.handlers.QueueHandler(self._log_queue)
     
     def start_game_session(self, is_test: bool = False) -> str:
         """开始新的游戏会话
@@ -52,6 +76,7 @@ class GameLogger:
             日志文件路径
         """
         self.is_test_mode = is_test
+        self._last_deck_status = None
         
         # 创建日志目录
         if is_test:
@@ -81,8 +106,25 @@ class GameLogger:
         )
         file_handler.setFormatter(formatter)
         
-        # 添加处理器到日志器
-        self.logger.addHandler(file_handler)
+        # 上一个会话未结束时先停掉它的后台写线程
+        self._stop_listener()
+        
+        # 攒够 128 条再写一次文件；警告及以上级别立即写入，保证问题及时可见
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=128,
+            flushLevel=logging.WARNING,
+            target=file_handler,
+            flushOnClose=True,
+        )
+        buffered_handler.setLevel(logging.INFO)
+        
+        # 文件处理器挂在后台监听线程上，日志器只挂队列处理器
+        self._listener = logging.handlers.QueueListener(
+            self._log_queue, buffered_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        if self._queue_handler not in self.logger.handlers:
+            self.logger.addHandler(self._queue_handler)
         
         # 记录游戏开始
         self.log_game_start()
@@ -92,26 +134,40 @@ class GameLogger:
     def end_game_session(self):
         """结束游戏会话"""
         if self.logger and self.log_file_path:
-            self.logger.info("=" * 50)
-            self.logger.info("游戏会话结束")
-            self.logger.info("=" * 50)
+            self.logger.info("\n".join(("=" * 50, "游戏会话结束", "=" * 50)))
             
-            # 移除文件处理器
-            for handler in self.logger.handlers[:]:
-                if isinstance(handler, logging.FileHandler):
-                    self.logger.removeHandler(handler)
-                    handler.close()
+            # 移除队列处理器，停止后台线程（会先写完队列中剩余的记录）
+            self.logger.removeHandler(self._queue_handler)
+            self._stop_listener()
             
             self.log_file_path = None
     
+    def _stop_listener(self):
+        """停止后台写日志线程，写出缓冲中的记录并关闭文件处理器"""
+        if self._listener is None:
+            return
+        self._listener.stop()
+        for buffered_handler in self._listener.handlers:
+            # MemoryHandler 关闭时会先把缓冲写入文件，但不会关闭目标处理器
+            file_handler = buffered_handler.target
+            buffered_handler.close()
+            file_handler.close()
+        self._listener = None
+    
+    def _enabled(self, level: int) -> bool:
+        """日志器是否会处理该级别的记录（不会处理时跳过拼接字符串）"""
+        return self.logger is not None and self.logger.isEnabledFor(level)
+    
     def log_game_start(self):
         """记录游戏开始"""
         if self.logger:
-            self.logger.info("=" * 50)
-            self.logger.info("游戏开始")
-            self.logger.info(f"时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            self.logger.info(f"模式: {'测试模式' if self.is_test_mode else '正常模式'}")
-            self.logger.info("=" * 50)
+            self.logger.info("\n".join((
+                "=" * 50,
+                "游戏开始",
+                f"时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                f"模式: {'测试模式' if self.is_test_mode else '正常模式'}",
+                "=" * 50,
+            )))
     
     def log_info(self, message: str):
         """记录信息日志"""
@@ -130,89 +186,86 @@ class GameLogger:
     
     def log_debug(self, message: str):
         """记录调试日志"""
-        if self.logger:
+        if self._enabled(logging.DEBUG):
             self.logger.debug(message)
     
     def log_player_draw_cards(self, player_name: str, cards: list):
         """记录玩家摸牌"""
         if self.logger and cards:
-            card_names = [card.name for card in cards]
-            self.logger.info(f"{player_name} 摸牌: {', '.join(card_names)}")
+            self.logger.info("%s 摸牌: %s", player_name, _Lazy(_join_card_names, cards))
     
     def log_player_play_card(self, player_name: str, card_name: str, targets: list = None, target_names: list = None):
         """记录玩家出牌"""
         if self.logger:
             if targets and target_names:
-                self.logger.info(f"{player_name} 使用 {card_name}，目标: {', '.join(target_names)}")
+                self.logger.info("%s 使用 %s，目标: %s", player_name, card_name, _Lazy(_join_names, target_names))
             elif targets:
-                target_id_names = [f"玩家{target}" for target in targets]
-                self.logger.info(f"{player_name} 使用 {card_name}，目标: {', '.join(target_id_names)}")
+                self.logger.info("%s 使用 %s，目标: %s", player_name, card_name, _Lazy(_join_player_ids, targets))
             else:
-                self.logger.info(f"{player_name} 使用 {card_name}")
+                self.logger.info("%s 使用 %s", player_name, card_name)
     
     def log_player_use_card(self, player_name: str, card_name: str, targets: list = None, target_names: list = None):
         """记录玩家使用牌（响应）"""
         if self.logger:
             if targets and target_names:
-                self.logger.info(f"{player_name} 使用 {card_name} 响应，目标: {', '.join(target_names)}")
+                self.logger.info("%s 使用 %s 响应，目标: %s", player_name, card_name, _Lazy(_join_names, target_names))
             elif targets:
-                target_id_names = [f"玩家{target}" for target in targets]
-                self.logger.info(f"{player_name} 使用 {card_name} 响应，目标: {', '.join(target_id_names)}")
+                self.logger.info("%s 使用 %s 响应，目标: %s", player_name, card_name, _Lazy(_join_player_ids, targets))
             else:
-                self.logger.info(f"{player_name} 使用 {card_name} 响应")
+                self.logger.info("%s 使用 %s 响应", player_name, card_name)
     
     def log_player_damage(self, player_name: str, damage: int, current_hp: int, max_hp: int):
         """记录玩家受伤"""
         if self.logger:
-            self.logger.info(f"{player_name} 受到 {damage} 点伤害，当前血量: {current_hp}/{max_hp}")
+            self.logger.info("%s 受到 %s 点伤害，当前血量: %s/%s", player_name, damage, current_hp, max_hp)
     
     def log_player_heal(self, player_name: str, heal: int, current_hp: int, max_hp: int):
         """记录玩家治疗"""
         if self.logger:
-            self.logger.info(f"{player_name} 恢复 {heal} 点血量，当前血量: {current_hp}/{max_hp}")
+            self.logger.info("%s 恢复 %s 点血量，当前血量: %s/%s", player_name, heal, current_hp, max_hp)
     
     def log_player_dying(self, player_name: str):
         """记录玩家濒死"""
         if self.logger:
-            self.logger.warning(f"{player_name} 濒死！")
+            self.logger.warning("%s 濒死！", player_name)
     
     def log_player_death(self, player_name: str, identity: str = None):
         """记录玩家死亡"""
         if self.logger:
             if identity:
-                self.logger.warning(f"{player_name} ({identity}) 死亡！")
+                self.logger.warning("%s (%s) 死亡！", player_name, identity)
             else:
-                self.logger.warning(f"{player_name} 死亡！")
+                self.logger.warning("%s 死亡！", player_name)
     
     def log_player_equip(self, player_name: str, equipment_name: str, equipment_type: str):
         """记录玩家装备"""
         if self.logger:
-            self.logger.info(f"{player_name} 装备 {equipment_name} ({equipment_type})")
+            self.logger.info("%s 装备 %s (%s)", player_name, equipment_name, equipment_type)
     
     def log_card_effect(self, card_name: str, effect_description: str):
         """记录牌效果"""
         if self.logger:
-            self.logger.info(f"{card_name} 效果: {effect_description}")
+            self.logger.info("%s 效果: %s", card_name, effect_description)
     
     def log_turn_start(self, player_name: str, turn_number: int):
         """记录回合开始"""
         if self.logger:
-            self.logger.info(f"=== 第 {turn_number} 回合开始，{player_name} 的回合 ===")
+            self.logger.info("=== 第 %s 回合开始，%s 的回合 ===", turn_number, player_name)
     
     def log_turn_end(self, player_name: str):
         """记录回合结束"""
         if self.logger:
-            self.logger.info(f"{player_name} 回合结束")
+            self.logger.info("%s 回合结束", player_name)
     
     def log_phase_start(self, player_name: str, phase: str):
         """记录阶段开始"""
         if self.logger:
-            self.logger.info(f"{player_name} 进入 {phase} 阶段")
+            self.logger.info("%s 进入 %s 阶段", player_name, phase)
     
     def log_game_event(self, event_description: str):
         """记录游戏事件"""
         if self.logger:
-            self.logger.info(f"游戏事件: {event_description}")
+            self.logger.info("游戏事件: %s", event_description)
     
     def log_player_status(self, player_name: str, player_id: int, current_hp: int, max_hp: int, 
                          hand_cards: list, weapon: object = None, armor: object = None, 
@@ -233,39 +286,45 @@ class GameLogger:
             identity: 身份
             character: 武将
         """
-        if self.logger:
-            # 基本信息
-            status_info = f"玩家{player_id} ({player_name})"
-            if identity:
-                status_info += f" [{identity}]"
-            if character:
-                status_info += f" ({character})"
-            status_info += f" - 血量: {current_hp}/{max_hp}"
-            
-            # 手牌信息
-            if hand_cards:
-                card_names = [card.name for card in hand_cards]
-                status_info += f" - 手牌: {', '.join(card_names)}"
-            else:
-                status_info += " - 手牌: 无"
-            
-            # 装备信息
-            equipment = []
-            if weapon:
-                equipment.append(f"武器: {weapon.name}")
-            if armor:
-                equipment.append(f"防具: {armor.name}")
-            if horse_plus:
-                equipment.append(f"防御马: {horse_plus.name}")
-            if horse_minus:
-                equipment.append(f"进攻马: {horse_minus.name}")
-            
-            if equipment:
-                status_info += f" - 装备: {', '.join(equipment)}"
-            else:
-                status_info += " - 装备: 无"
-            
-            self.logger.info(status_info)
+        if self._enabled(logging.INFO):
+            self.logger.info(self._format_player_status(
+                player_name, player_id, current_hp, max_hp, hand_cards,
+                weapon, armor, horse_plus, horse_minus, identity, character
+            ))
+    
+    @staticmethod
+    def _format_player_status(player_name: str, player_id: int, current_hp: int, max_hp: int,
+                              hand_cards: list, weapon: object = None, armor: object = None,
+                              horse_plus: object = None, horse_minus: object = None,
+                              identity: str = None, character: str = None) -> str:
+        """把玩家状态格式化为一行文本，参数同 log_player_status"""
+        # 基本信息
+        header = f"玩家{player_id} ({player_name})"
+        if identity:
+            header += f" [{identity}]"
+        if character:
+            header += f" ({character})"
+        parts = [header, f"血量: {current_hp}/{max_hp}"]
+        
+        # 手牌信息
+        if hand_cards:
+            parts.append(f"手牌: {', '.join(card.name for card in hand_cards)}")
+        else:
+            parts.append("手牌: 无")
+        
+        # 装备信息
+        equipment = []
+        if weapon:
+            equipment.append(f"武器: {weapon.name}")
+        if armor:
+            equipment.append(f"防具: {armor.name}")
+        if horse_plus:
+            equipment.append(f"防御马: {horse_plus.name}")
+        if horse_minus:
+            equipment.append(f"进攻马: {horse_minus.name}")
+        parts.append(f"装备: {', '.join(equipment)}" if equipment else "装备: 无")
+        
+        return " - ".join(parts)
     
     def log_deck_status(self, deck):
         """记录牌堆状态
@@ -273,50 +332,56 @@ class GameLogger:
         Args:
             deck: 牌堆对象
         """
-        if self.logger:
-            self.logger.info("=" * 60)
-            self.logger.info("当前牌堆状态:")
-            
-            # 正常牌堆信息
-            deck_size = deck.get_deck_size()
-            self.logger.info(f"正常牌堆: {deck_size} 张牌")
-            
-            # 弃牌堆信息
-            discard_size = deck.get_discard_size()
-            self.logger.info(f"弃牌堆: {discard_size} 张牌")
-            
-            # 如果弃牌堆有牌，显示最后几张牌的信息
-            if discard_size > 0:
-                recent_discards = deck.discard_pile[-5:] if discard_size >= 5 else deck.discard_pile
-                discard_names = [card.name for card in recent_discards]
-                if discard_size > 5:
-                    self.logger.info(f"弃牌堆最后5张牌: {', '.join(discard_names)}")
-                else:
-                    self.logger.info(f"弃牌堆所有牌: {', '.join(discard_names)}")
-            
-            self.logger.info("=" * 60)
+        if not self._enabled(logging.INFO):
+            return
+        
+        deck_size = deck.get_deck_size()
+        discard_size = deck.get_discard_size()
+        # 牌堆没有变化时不重复记录
+        status = (id(deck), deck_size, discard_size)
+        if status == self._last_deck_status:
+            return
+        self._last_deck_status = status
+        
+        lines = [
+            "=" * 60,
+            "当前牌堆状态:",
+            f"正常牌堆: {deck_size} 张牌",
+            f"弃牌堆: {discard_size} 张牌",
+        ]
+        
+        # 如果弃牌堆有牌，显示最后几张牌的信息
+        if discard_size > 0:
+            discard_names = ', '.join(card.name for card in deck.discard_pile[-5:])
+            lines.append(f"弃牌堆最后{min(5, discard_size)}张牌: {discard_names}")
+        
+        lines.append("=" * 60)
+        # 合并为一条记录，只经过一次处理器
+        self.logger.info("\n".join(lines))
     
     def log_all_players_status(self, players: list):
-        """记录所有玩家状态"""
-        if self.logger:
-            self.logger.info("=" * 60)
-            self.logger.info("当前所有玩家状态:")
-            for player in players:
-                self.log_player_status(
-                    player_name=player.name,
-                    player_id=player.player_id,
-                    current_hp=player.current_hp,
-                    max_hp=player.max_hp,
-                    hand_cards=player.hand_cards,
-                    weapon=player.weapon,
-                    armor=player.armor,
-                    horse_plus=player.horse_plus,
-                    horse_minus=player.horse_minus,
-                    identity=player.identity.value if player.identity else None,
-                    character=player.character_name.value if player.character_name else None
-                )
-            self.logger.info("=" * 60)
+        """记录所有玩家状态（合并为一条多行记录）"""
+        if not self._enabled(logging.INFO):
+            return
+        
+        lines = ["=" * 60, "当前所有玩家状态:"]
+        for player in players:
+            lines.append(self._format_player_status(
+                player_name=player.name,
+                player_id=player.player_id,
+                current_hp=player.current_hp,
+                max_hp=player.max_hp,
+                hand_cards=player.hand_cards,
+                weapon=player.weapon,
+                armor=player.armor,
+                horse_plus=player.horse_plus,
+                horse_minus=player.horse_minus,
+                identity=player.identity.value if player.identity else None,
+                character=player.character_name.value if player.character_name else None
+            ))
+        lines.append("=" * 60)
+        self.logger.info("\n".join(lines))
 
 
-# 全局日志器实例
+# 全局日志器实例（模块导入时创建一次，即单例）
 game_logger = GameLogger()
@@ -1,76 +1,107 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import ClassVar
 from config.simple_card_config import SimpleGameConfig, SimpleCardConfig
 from config.enums import EquipmentType, CardName
 class CommEvent:
-    """Base class for communication events."""
-    pass
+    """Base class for communication events.
 
+    事件类均为 slots dataclass，不带 __dict__；_event_id 由 Communicator 发送时写入。
+    kind 是类级别的类别标记，Communicator 用整数比较分派，代替 isinstance。
+    """
+    __slots__ = ("_event_id",)
+    kind: ClassVar[int] = 0
+
+@dataclass(slots=True, eq=False)
 class DrawCardEvent(CommEvent):
-    def __init__(self, card_config: SimpleCardConfig = None, to_player: int = None):
-        self.card_config = card_config  # None表示牌面信息不可见
-        self.to_player = to_player
+    card_config: SimpleCardConfig = None  # None表示牌面信息不可见
+    to_player: int = None
+@dataclass(slots=True, eq=False)
 class PlayCardEvent(CommEvent):
-    def __init__(self, card_config: SimpleCardConfig, from_player: int, to_player: int, 
-                 response_type: str = None, response_target: int = None, 
-                 original_card_name: str = None, is_effective: bool = None):
-        """
-        出牌事件
-        
-        Args:
-            card_config: 牌配置
-            from_player: 出牌玩家ID
-            to_player: 目标玩家ID
-            response_type: 响应类型（"响应决斗"、"响应南蛮入侵"、"响应万箭齐发"、"响应杀"等）
-            response_target: 响应目标（对于响应类事件，表示响应的目标玩家ID）
-            original_card_name: 原始牌名（对于响应类事件，表示响应的原始牌）
-            is_effective: 是否生效（对于无懈可击，表示目标是否生效）
-        """
-        self.card_config = card_config
-        self.from_player = from_player
-        self.to_player = to_player
-        self.response_type = response_type  # 响应类型
-        self.response_target = response_target  # 响应目标
-        self.original_card_name = original_card_name  # 原始牌名
-        self.is_effective = is_effective  # 是否生效（无懈可击用）
+    """
+    出牌事件
+
+    Args:
+        card_config: 牌配置
+        from_player: 出牌玩家ID
+        to_player: 目标玩家ID
+        response_type: 响应类型（"响应决斗"、"响应南蛮入侵"、"响应万箭齐发"、"响应杀"等）
+        response_target: 响应目标（对于响应类事件，表示响应的目标玩家ID）
+        original_card_name: 原始牌名（对于响应类事件，表示响应的原始牌）
+        is_effective: 是否生效（对于无懈可击，表示目标是否生效）
+    """
+    card_config: SimpleCardConfig
+    from_player: int
+    to_player: int
+    response_type: str = None  # 响应类型
+    response_target: int = None  # 响应目标
+    original_card_name: str = None  # 原始牌名
+    is_effective: bool = None  # 是否生效（无懈可击用）
+@dataclass(slots=True, eq=False)
 class DiscardCardEvent(CommEvent):
-    def __init__(self, card_config: SimpleCardConfig, player: int):
-        self.card_config = card_config
-        self.player = player
+    card_config: SimpleCardConfig
+    player: int
+@dataclass(slots=True, eq=False)
 class HPChangeEvent(CommEvent):
-    def __init__(self, player_id: int, new_hp: int, source_player_id: int = None, 
-                 damage_type: str = None, original_card_name: str = None):
-        """
-        血量变化事件
-        
-        Args:
-            player_id: 玩家ID
-            new_hp: 新的血量值
-            source_player_id: 伤害来源玩家ID（如果是伤害）
-            damage_type: 伤害类型（"杀"、"决斗"、"南蛮入侵"、"万箭齐发"等）
-            original_card_name: 原始牌名（造成伤害的牌）
-        """
-        self.player_id = player_id
-        self.new_hp = new_hp
-        self.source_player_id = source_player_id  # 伤害来源
-        self.damage_type = damage_type  # 伤害类型
-        self.original_card_name = original_card_name  # 原始牌名
+    """
+    血量变化事件
+
+    Args:
+        player_id: 玩家ID
+        new_hp: 新的血量值
+        source_player_id: 伤害来源玩家ID（如果是伤害）
+        damage_type: 伤害类型（"杀"、"决斗"、"南蛮入侵"、"万箭齐发"等）
+        original_card_name: 原始牌名（造成伤害的牌）
+    """
+    player_id: int
+    new_hp: int
+    source_player_id: int = None  # 伤害来源
+    damage_type: str = None  # 伤害类型
+    original_card_name: str = None  # 原始牌名
+@dataclass(slots=True, eq=False)
 class EquipChangeEvent(CommEvent):
-    def __init__(self, player_id: int, equip_name: CardName, equip_type: EquipmentType):
-        self.player_id = player_id
-        self.equip_name = equip_name
-        self.equip_type = equip_type
+    player_id: int
+    equip_name: CardName
+    equip_type: EquipmentType
+@dataclass(slots=True, eq=False)
 class DeathEvent(CommEvent):
-    def __init__(self, player_id: int):
-        self.player_id = player_id
+    player_id: int
+@dataclass(slots=True, eq=False)
 class GameOverEvent(CommEvent):
-    def __init__(self, winner_id: int):
-        self.winner_id = winner_id
+    winner_id: int
 
+@dataclass(slots=True, eq=False)
 class AckEvent(CommEvent):
-    """ACK确认事件"""
-    def __init__(self, original_event_id: int, success: bool = True, message: str = ""):
-        self.original_event_id = original_event_id
-        self.success = success
-        self.message = message
+    """ACK确认事件
+
+    每个需要确认的事件都会产生一个 ACK，且只由 Communicator 消费一次，
+    因此用空闲列表复用实例：发送方用 acquire() 取得，消费方处理完后 release() 归还。
+    """
+    kind: ClassVar[int] = 1
+    _pool: ClassVar["deque[AckEvent]"] = deque()
+    _POOL_SIZE: ClassVar[int] = 128  # 空闲列表上限，超出的实例直接丢弃交给 GC
+
+    original_event_id: int
+    success: bool = True
+    message: str = ""
+
+    @classmethod
+    def acquire(cls, original_event_id: int, success: bool = True, message: str = "") -> "AckEvent":
+        """从空闲列表取一个 ACK 并重新赋值，空闲列表为空时新建。"""
+        try:
+            event = cls._pool.pop()
+        except IndexError:
+            return cls(original_event_id, success, message)
+        event.original_event_id = original_event_id
+        event.success = success
+        event.message = message
+        return event
+
+    def release(self) -> None:
+        """归还到空闲列表；调用后不得再使用该实例。"""
+        if len(self._pool) < self._POOL_SIZE:
+            self._pool.append(self)
+@dataclass(slots=True, eq=False)
 class InputRequestEvent(CommEvent):
     """后端 -> 前端：请求玩家输入（选牌/选目标/弃牌/是否发动技能）。
 
@@ -82,14 +113,18 @@ class InputRequestEvent(CommEvent):
         options: 结构化选项数据（dict），由 action 约定字段。
     """
 
-    def __init__(self, request_id: str, player_id: int, action: str, prompt: str = "", options: dict = None):
-        self.request_id = request_id
-        self.player_id = player_id
-        self.action = action
-        self.prompt = prompt
-        self.options = options or {}
+    request_id: str
+    player_id: int
+    action: str
+    prompt: str = ""
+    options: dict = None
 
+    def __post_init__(self):
+        if not self.options:
+            self.options = {}
 
+
+@dataclass(slots=True, eq=False)
 class InputResponseEvent(CommEvent):
     """前端 -> 后端：提交玩家输入结果。
 
@@ -104,7 +139,10 @@ class InputResponseEvent(CommEvent):
             - ask_activate_skill: {"activate": bool}
     """
 
-    def __init__(self, request_id: str, player_id: int, payload: dict):
-        self.request_id = request_id
-        self.player_id = player_id
-        self.payload = payload or {}
+    request_id: str
+    player_id: int
+    payload: dict
+
+    def __post_init__(self):
+        if not self.payload:
+            self.payload = {}
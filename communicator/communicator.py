@@ -1,32 +1,126 @@
+import itertools
 import queue
 import threading
 import time
-from typing import Optional, Dict, Tuple
+from collections import deque
+from concurrent.futures import CancelledError, Future, InvalidStateError, TimeoutError, wait
+from typing import Callable, Optional, Dict, List, Tuple
 from communicator.comm_event import CommEvent, AckEvent
 
 
+class _EventQueue:
+    """
+    单生产者/单消费者事件队列：collections.deque + threading.Event。
+
+    deque 的 append/popleft 在 CPython 中是原子操作，无需 queue.Queue 的锁与条件变量；
+    Event 只在队列为空、消费者需要阻塞等待时使用。接口与 queue.Queue 的常用部分保持一致。
+
+    maxlen 不为 None 时是定长环形缓冲：队满后 put 丢弃最旧的事件（deque 在 C 层完成，仍然无锁）。
+    被丢弃的事件在入队后交给 on_drop 回调，以便结束它们仍在等待的 ACK。
+    """
+
+    def __init__(self, maxlen: Optional[int] = None,
+                 on_drop: Optional[Callable[[List[CommEvent]], None]] = None) -> None:
+        self._items: "deque[CommEvent]" = deque(maxlen=maxlen)
+        self._nonempty = threading.Event()
+        self._on_drop = on_drop
+
+    def _evicted(self, items: List[CommEvent]) -> List[CommEvent]:
+        """入队 items 时会被环形缓冲挤掉的事件（队首的旧事件，批量超过容量时也包括 items 的开头）。"""
+        maxlen = self._items.maxlen
+        if maxlen is None or self._on_drop is None:
+            return []
+        overflow = len(self._items) + len(items) - maxlen
+        if overflow <= 0:
+            return []
+        return list(itertools.islice(itertools.chain(self._items, items), overflow))
+
+    def put(self, item: CommEvent) -> None:
+        dropped = self._evicted([item])
+        self._items.append(item)
+        self._nonempty.set()
+        if dropped:
+            self._on_drop(dropped)
+
+    def put_many(self, items: List[CommEvent]) -> None:
+        dropped = self._evicted(items)
+        self._items.extend(items)
+        self._nonempty.set()
+        if dropped:
+            self._on_drop(dropped)
+
+    def get_nowait(self) -> CommEvent:
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty from None
+
+    def get_all(self) -> List[CommEvent]:
+        """取出当前队列中的全部事件（不阻塞，队列为空时返回空列表）。"""
+        items = self._items
+        out: List[CommEvent] = []
+        # 单消费者：队列非空时 popleft 必然成功，用真值判断结束循环，不靠抛 IndexError
+        while items:
+            out.append(items.popleft())
+        return out
+
+    def get(self, timeout: Optional[float] = None) -> CommEvent:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self._items.popleft()
+            except IndexError:
+                pass
+            # 先清标志再复查，避免生产者在两步之间 put 导致信号丢失
+            self._nonempty.clear()
+            if self._items:
+                continue
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise queue.Empty
+            if not self._nonempty.wait(remaining):
+                raise queue.Empty
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+
 class Communicator:
     """
     后端 <-> 前端 的简易事件总线 + ACK 确认机制。
     """
 
-    def __init__(self) -> None:
-        self.btf_queue: "queue.Queue[CommEvent]" = queue.Queue()
-        self.ftb_queue: "queue.Queue[CommEvent]" = queue.Queue()
+    # backend->frontend 队列容量。无界面运行（批量对局、训练）时没有前端消费，
+    # 定长后最多只保留最近的事件，不会无限增长；有前端时每帧都会取空，远到不了上限。
+    # 被挤掉的事件若仍在等待 ACK，立即以 (False, "Event dropped: frontend queue full") 结束等待，见 _drop_pending。
+    BTF_QUEUE_CAPACITY = 4096
 
-        self._ack_inbox: "queue.Queue[AckEvent]" = queue.Queue()
+    def __init__(self) -> None:
+        self.btf_queue = _EventQueue(maxlen=self.BTF_QUEUE_CAPACITY, on_drop=self._drop_pending)
+        self.ftb_queue = _EventQueue()
 
-        self.event_counter = 0
-        self.pending_acks: Dict[int, threading.Event] = {}
-        self.ack_results: Dict[int, Tuple[bool, str]] = {}
+        # 事件ID生成器：next() 在 GIL 下是原子的，不需要加锁
+        self._event_ids = itertools.count(1)
+        # event_id -> 等待 ACK 的 Future，结果为 (success, message)
+        self.pending: Dict[int, "Future[Tuple[bool, str]]"] = {}
         self.lock = threading.Lock()
+        # backend->frontend 队列的入队通知，见 set_backend_listener
+        self._btf_listener: Optional[Callable[[], None]] = None
 
-        self._stop_event = threading.Event()
+    def set_backend_listener(self, listener: Optional[Callable[[], None]]) -> None:
+        """
+        注册 backend->frontend 有新事件时的通知回调（如唤醒阻塞在 pygame.event.wait 上的前端主循环）；
+        传 None 取消。回调在发送方（后端）线程中调用，必须线程安全且不阻塞。
+        """
+        self._btf_listener = listener
 
-        self.ack_thread = threading.Thread(
-            target=self._process_acks, name="comm-ack-thread", daemon=True
-        )
-        self.ack_thread.start()
+    def _notify_frontend(self) -> None:
+        listener = self._btf_listener
+        if listener is not None:
+            listener()
 
     def send_to_frontend(
         self,
@@ -42,50 +136,109 @@ class Communicator:
             - wait_for_ack=False 时，返回 (None, None)
             - wait_for_ack=True 时，返回 (True/False, msg)
         """
+        event_id = next(self._event_ids)
+        event._event_id = event_id
         if not wait_for_ack:
-            with self.lock:
-                self.event_counter += 1
-                event_id = self.event_counter
-                setattr(event, "_event_id", event_id)
-
             self.btf_queue.put(event)
+            self._notify_frontend()
             return None, None
 
+        ack_future: "Future[Tuple[bool, str]]" = Future()
         with self.lock:
-            self.event_counter += 1
-            event_id = self.event_counter
-            setattr(event, "_event_id", event_id)
-            ack_event = threading.Event()
-            self.pending_acks[event_id] = ack_event
+            self.pending[event_id] = ack_future
 
         self.btf_queue.put(event)
+        self._notify_frontend()
+
+        try:
+            return ack_future.result(timeout=timeout)
+        except TimeoutError:
+            return False, "ACK timeout"
+        except CancelledError:
+            return False, "ACK cancelled"
+        finally:
+            with self.lock:
+                self.pending.pop(event_id, None)
+
+    def send_many_to_frontend(
+        self,
+        events: List[CommEvent],
+        wait_for_ack: bool = False,
+        timeout: float = 30.0,
+    ) -> Tuple[Optional[bool], Optional[str]]:
+        """
+        批量发送事件到前端（如群体锦囊对每个目标各一条事件）；可选择等待全部 ACK。
 
-        ack_received = ack_event.wait(timeout=timeout)
+        所有事件一次入队后再统一等待，总等待时间约为一次往返，而不是逐条发送逐条等待。
 
+        Returns:
+            (success: bool | None, message: str | None)
+            - wait_for_ack=False 时，返回 (None, None)
+            - wait_for_ack=True 时，全部成功返回最后一条的结果，否则返回第一条失败的结果
+        """
+        event_ids = [next(self._event_ids) for _ in events]
+        for event, event_id in zip(events, event_ids):
+            event._event_id = event_id
+        if not wait_for_ack:
+            self.btf_queue.put_many(events)
+            self._notify_frontend()
+            return None, None
+
+        ack_futures: "List[Future[Tuple[bool, str]]]" = [Future() for _ in events]
         with self.lock:
-            self.pending_acks.pop(event_id, None)
-            result = self.ack_results.pop(event_id, (False, "ACK timeout"))
+            self.pending.update(zip(event_ids, ack_futures))
+
+        self.btf_queue.put_many(events)
+        self._notify_frontend()
 
-        return result
+        try:
+            _, not_done = wait(ack_futures, timeout=timeout)
+            if not_done:
+                return False, "ACK timeout"
+            result: Tuple[Optional[bool], Optional[str]] = (None, None)
+            for ack_future in ack_futures:
+                if ack_future.cancelled():
+                    return False, "ACK cancelled"
+                result = ack_future.result()
+                if not result[0]:
+                    return result
+            return result
+        finally:
+            with self.lock:
+                for event_id in event_ids:
+                    self.pending.pop(event_id, None)
 
     def send_to_backend(self, event: CommEvent) -> None:
         """
         前端 -> 后端：投递消息到后端消费。
-        若为 AckEvent，额外复制一份进 _ack_inbox 供 ACK 线程消费。
+        AckEvent 不入队，直接在调用线程中唤醒等待该 event_id 的发送方；
+        若无人等待（不需要 ACK），直接丢弃，防泄漏。
         """
+        if event.kind == AckEvent.kind:
+            self._resolve_ack(event)
+            return
         self.ftb_queue.put(event)
-        if isinstance(event, AckEvent):
-            self._ack_inbox.put(event)
 
     def receive_from_frontend(self) -> Optional[CommEvent]:
-        if self.ftb_queue.empty():
+        try:
+            return self.ftb_queue.get_nowait()
+        except queue.Empty:
             return None
-        return self.ftb_queue.get()
 
     def receive_from_backend(self) -> Optional[CommEvent]:
-        if self.btf_queue.empty():
+        try:
+            return self.btf_queue.get_nowait()
+        except queue.Empty:
             return None
-        return self.btf_queue.get()
+
+    def receive_all_from_backend(self) -> List[CommEvent]:
+        """
+        前端每帧调用：一次取出 backend->frontend 队列中的全部事件（不阻塞）。
+        """
+        return self.btf_queue.get_all()
+
+    def has_backend_events(self) -> bool:
+        return not self.btf_queue.empty()
 
     def get_from_frontend(self, timeout: Optional[float] = None) -> CommEvent:
         return self.ftb_queue.get(timeout=timeout)
@@ -93,47 +246,39 @@ class Communicator:
     def get_from_backend(self, timeout: Optional[float] = None) -> CommEvent:
         return self.btf_queue.get(timeout=timeout)
 
-    def stop(self, wait: bool = True) -> None:
+    def stop(self) -> None:
         """
-        停止 ACK 处理线程。
+        取消所有仍在等待 ACK 的发送，唤醒阻塞中的发送方。
         """
-        self._stop_event.set()
-        self._ack_inbox.put(None)  # type: ignore
-        if wait:
-            self.ack_thread.join(timeout=5.0)
+        with self.lock:
+            pending = list(self.pending.values())
+            self.pending.clear()
+        for ack_future in pending:
+            ack_future.cancel()
 
-    def _process_acks(self) -> None:
-        """
-        专职处理来自前端的 AckEvent：
-        - 若有人等待该 event_id，则写入结果并唤醒；
-        - 若无人等待（不需要 ACK），直接丢弃，防泄漏。
-        """
-        while not self._stop_event.is_set():
-            try:
-                item = self._ack_inbox.get(timeout=0.5)
-                if item is None:
-                    continue
-
-                if not isinstance(item, AckEvent):
-                    continue
-
-                original_id = getattr(item, "original_event_id", None)
-                success = getattr(item, "success", False)
-                message = getattr(item, "message", "")
-
-                with self.lock:
-                    waiter = self.pending_acks.get(original_id)
-                    if waiter is not None:
-                        self.ack_results[original_id] = (bool(success), str(message))
-                        waiter.set()
-                    else:
-                        pass
-
-            except queue.Empty:
+    def _drop_pending(self, events: List[CommEvent]) -> None:
+        """backend->frontend 队列满时被丢弃的事件不会再有 ACK：结束其等待中的 Future，发送方不必等到超时。"""
+        with self.lock:
+            dropped = [self.pending.pop(event._event_id, None) for event in events]
+        for ack_future in dropped:
+            if ack_future is None:
                 continue
-            except Exception as e:
-                print(f"[Communicator] Error processing ACK: {e}")
-                time.sleep(0.1)
+            try:
+                ack_future.set_result((False, "Event dropped: frontend queue full"))
+            except InvalidStateError:
+                # 发送方已超时/被取消
+                pass
 
+    def _resolve_ack(self, ack: AckEvent) -> None:
+        """把 AckEvent 的结果交给等待中的 Future，然后归还 AckEvent。"""
+        with self.lock:
+            ack_future = self.pending.pop(ack.original_event_id, None)
+        if ack_future is not None:
+            try:
+                ack_future.set_result((bool(ack.success), str(ack.message)))
+            except InvalidStateError:
+                # 发送方已超时/被取消
+                pass
+        ack.release()
 
 communicator = Communicator()
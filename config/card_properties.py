@@ -1,4 +1,7 @@
 # 牌属性配置文件
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 from .enums import CardType, TargetType, CardName
 
 # 每张牌的固定属性配置
@@ -87,18 +90,32 @@ CARD_PROPERTIES = {
 }
 
 
-def get_card_properties(card_name: CardName) -> dict:
+# 属性表只读：各条目包装为 MappingProxyType，调用方可以放心共享同一对象
+CARD_PROPERTIES = {
+    card_name: MappingProxyType(properties)
+    for card_name, properties in CARD_PROPERTIES.items()
+}
+
+
+# 未登记牌名的默认属性（display_name 取牌名枚举值，在 get_card_properties 中补上）
+_DEFAULT_PROPERTIES = MappingProxyType({
+    "card_type": CardType.BASIC,
+    "target_type": TargetType.ATTACKABLE,
+    "attack_range": 1
+})
+
+
+@lru_cache(maxsize=None)
+def get_card_properties(card_name: CardName) -> Mapping:
     """获取指定牌名的属性
     
     Args:
         card_name: 牌名枚举
         
     Returns:
-        包含display_name, card_type, target_type, attack_range的字典
+        包含display_name, card_type, target_type, attack_range的只读映射
+        （结果按牌名缓存，同一牌名每次返回同一对象）
     """
-    return CARD_PROPERTIES.get(card_name, {
-        "display_name": card_name.value,
-        "card_type": CardType.BASIC,
-        "target_type": TargetType.ATTACKABLE,
-        "attack_range": 1
-    })
\ No newline at end of file
+    return CARD_PROPERTIES.get(card_name) or MappingProxyType(
+        {"display_name": card_name.value, **_DEFAULT_PROPERTIES}
+    )
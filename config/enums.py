@@ -1,27 +1,39 @@
 # 枚举定义文件
 from enum import Enum
 
-class CardSuit(Enum):
+
+class FastHashEnum(Enum):
+    """按对象身份计算哈希的枚举基类
+
+    Enum 默认的 __hash__ 是 Python 层的 hash(self._name_)，枚举作为字典键（牌属性表、
+    各种映射表）时每次查找都要走一次函数调用。枚举成员是单例且 == 本就按身份比较，
+    因此直接使用 object.__hash__（C 层实现），查找速度与 IntEnum 相同，
+    同时保留字符串 value 作为显示文本。
+    """
+    __hash__ = object.__hash__
+
+
+class CardSuit(FastHashEnum):
     """花色枚举"""
     HEARTS = "红桃"
     DIAMONDS = "方块"
     CLUBS = "梅花"
     SPADES = "黑桃"
 
-class CardType(Enum):
+class CardType(FastHashEnum):
     """牌类型枚举"""
     BASIC = "基本牌"
     TRICK = "锦囊牌"
     EQUIPMENT = "装备牌"
 
-class EquipmentType(Enum):
+class EquipmentType(FastHashEnum):
     """装备类型枚举"""
     WEAPON = "武器"
     ARMOR = "防具"
     HORSE_PLUS = "+1马"
     HORSE_MINUS = "-1马"
 
-class EquipmentName(Enum):
+class EquipmentName(FastHashEnum):
     # 装备牌 - 武器
     ZHU_GE_LIAN_NU = "诸葛连弩"
     CI_XIONG_SHUANG_GU_JIAN = "雌雄双股剑"
@@ -45,7 +57,7 @@ class EquipmentName(Enum):
     JIN_GONG_MA = "进攻马"  # +1马
     FANG_YU_MA = "防御马"   # -1马
 
-class GameEvent(Enum):
+class GameEvent(FastHashEnum):
     """游戏事件枚举"""
     PREPARE = "准备阶段"
     DRAW_CARD = "摸牌"
@@ -56,25 +68,25 @@ class GameEvent(Enum):
     DEATH = "死亡"
     EQUIP = "装备"
 
-class PlayerStatus(Enum):
+class PlayerStatus(FastHashEnum):
     """玩家状态枚举"""
     ALIVE = "存活"
     DEAD = "死亡"
 
-class ControlType(Enum):
+class ControlType(FastHashEnum):
     """操控类型枚举"""
     HUMAN = "玩家操控"
     AI = "AI操控"
     SIMPLE_AI = "规则操控"
 
-class PlayerIdentity(Enum):
+class PlayerIdentity(FastHashEnum):
     """玩家身份枚举"""
     LORD = "主公"      # 主公
     LOYALIST = "忠臣"  # 忠臣
     REBEL = "反贼"     # 反贼
     TRAITOR = "内奸"   # 内奸
 
-class CharacterName(Enum):
+class CharacterName(FastHashEnum):
     """武将名枚举"""
     BAI_BAN_WU_JIANG = "白板武将"  # 白板武将
 
@@ -122,14 +134,14 @@ class CharacterName(Enum):
     ZHU_GUO_SHA = "猪国杀武将"     # 猪国杀武将（无弃牌阶段）
 
 
-class TargetType(Enum):
+class TargetType(FastHashEnum):
     """目标类型枚举"""
     ATTACKABLE = "攻击范围内的目标"  # 攻击范围内的目标
     DIS1 = "距离为1的目标"         # 距离为1的目标
     ALL = "所有目标"              # 所有目标
     SELF = "自己"                # 自己
 
-class CardName(Enum):
+class CardName(FastHashEnum):
     """牌名枚举"""
     # 基本牌
     SHA = "杀"
@@ -175,20 +187,20 @@ class CardName(Enum):
     JIN_GONG_MA = "进攻马"  # +1马
     FANG_YU_MA = "防御马"   # -1马
 
-class EffectName(Enum):
+class EffectName(FastHashEnum):
     """特效名称枚举"""
     HURT = "hurt"
     HEAL = "heal"
     DAMAGE = "damage"
     BOOM = "boom"
 
-class Faction(Enum):
+class Faction(FastHashEnum):
     """阵营名称枚举"""
     WEI = "魏"
     SHU = "蜀"
     WU = "吴"
     QUN = "群"
 
-class Gender(Enum):
+class Gender(FastHashEnum):
     MALE="男"
     FEMALE="女"
\ No newline at end of file
@@ -1,21 +1,28 @@
 # 简化牌配置
+import sys
+from operator import attrgetter
 from typing import List, Dict, Any
 from dataclasses import dataclass
 from .enums import CardSuit, CardName, ControlType, PlayerIdentity, CharacterName
 
 
-@dataclass
+# to_dict 用：一次取出序列化所需的全部字段（C 层实现，比逐个属性链访问快）
+_CARD_FIELDS = attrgetter("name.name", "suit.name", "rank", "count")
+_PLAYER_FIELDS = attrgetter("name", "character_name.name", "identity.name", "control_type.name", "ai_difficulty")
+
+
+@dataclass(frozen=True, slots=True)
 class SimpleCardConfig:
-    """简化的牌配置，只包含牌名、花色、点数"""
+    """简化的牌配置，只包含牌名、花色、点数（不可变，可作字典键/集合元素）"""
     name: CardName  # 牌名
     suit: CardSuit  # 花色
     rank: int  # 点数
     count: int = 1  # 该牌的数量
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SimplePlayerConfig:
-    """简化的玩家配置"""
+    """简化的玩家配置（不可变，修改请用 dataclasses.replace）"""
     name: str  # 玩家名称
     character_name: CharacterName = CharacterName.BAI_BAN_WU_JIANG  # 武将名
     identity: PlayerIdentity = PlayerIdentity.REBEL  # 身份
@@ -35,11 +42,14 @@ class SimpleGameConfig:
     shuffle_deck: bool = True  # 是否打乱牌堆
     
     @classmethod
-    def from_dict(cls, config_dict: Dict[str, Any]) -> 'SimpleGameConfig':
+    def from_dict(cls, config_dict: Dict[str, Any], validate: bool = True) -> 'SimpleGameConfig':
         """从字典创建配置对象
         
         Args:
             config_dict: 配置字典（必须由 to_dict() 方法产生）
+            validate: 是否校验字段。来自文件/网络等不可信输入时必须为 True；
+                程序内部刚由 to_dict() 产生的字典（对局回放、AI 自对弈）可传 False，
+                跳过全部校验与 ai_difficulty 规范化，直接做枚举查找
             
         Returns:
             配置对象
@@ -49,6 +59,9 @@ class SimpleGameConfig:
             KeyError: 如果枚举值不存在
             TypeError: 如果字段类型不正确
         """
+        if not validate:
+            return cls._from_trusted_dict(config_dict)
+        
         if not isinstance(config_dict, dict):
             raise TypeError(f"config_dict 必须是字典类型，实际类型: {type(config_dict)}")
         
@@ -58,49 +71,31 @@ class SimpleGameConfig:
         if not isinstance(config_dict["deck"], list):
             raise TypeError(f"'deck' 必须是列表类型，实际类型: {type(config_dict['deck'])}")
         
+        # 枚举名在 JSON 中是新分配的字符串；驻留后与 __members__ 的键是同一对象，
+        # 字典查找走哈希缓存 + 身份比较的快速路径
+        intern = sys.intern
+        card_names = CardName.__members__
+        card_suits = CardSuit.__members__
         deck_config = []
         for idx, card_data in enumerate(config_dict["deck"]):
-            if not isinstance(card_data, dict):
-                raise TypeError(f"'deck[{idx}]' 必须是字典类型，实际类型: {type(card_data)}")
-            
-            # 检查必需字段
-            if "name" not in card_data:
-                raise ValueError(f"'deck[{idx}]' 缺少必需字段 'name'")
-            if "suit" not in card_data:
-                raise ValueError(f"'deck[{idx}]' 缺少必需字段 'suit'")
-            if "rank" not in card_data:
-                raise ValueError(f"'deck[{idx}]' 缺少必需字段 'rank'")
-            if "count" not in card_data:
-                raise ValueError(f"'deck[{idx}]' 缺少必需字段 'count'")
-            
-            # 检查字段类型并转换枚举
-            if not isinstance(card_data["name"], str):
-                raise TypeError(f"'deck[{idx}].name' 必须是字符串类型，实际类型: {type(card_data['name'])}")
-            try:
-                card_name = CardName[card_data["name"]]
-            except KeyError:
-                raise ValueError(f"'deck[{idx}].name' 无效的枚举值: {card_data['name']}")
-            
-            if not isinstance(card_data["suit"], str):
-                raise TypeError(f"'deck[{idx}].suit' 必须是字符串类型，实际类型: {type(card_data['suit'])}")
             try:
-                card_suit = CardSuit[card_data["suit"]]
-            except KeyError:
-                raise ValueError(f"'deck[{idx}].suit' 无效的枚举值: {card_data['suit']}")
-            
-            if not isinstance(card_data["rank"], int):
-                raise TypeError(f"'deck[{idx}].rank' 必须是整数类型，实际类型: {type(card_data['rank'])}")
-            
-            if not isinstance(card_data["count"], int):
-                raise TypeError(f"'deck[{idx}].count' 必须是整数类型，实际类型: {type(card_data['count'])}")
+                card_name = card_names[intern(card_data["name"])]
+                card_suit = card_suits[intern(card_data["suit"])]
+                rank = card_data["rank"]
+                count = card_data["count"]
+                if not (isinstance(rank, int) and isinstance(count, int)):
+                    raise TypeError
+            except (KeyError, TypeError):
+                # 快速路径失败时再逐项校验，抛出带字段信息的异常
+                _check_card_data(idx, card_data)
+                raise
             
-            card_config = SimpleCardConfig(
+            deck_config.append(SimpleCardConfig(
                 name=card_name,
                 suit=card_suit,
-                rank=card_data["rank"],
-                count=card_data["count"]
-            )
-            deck_config.append(card_config)
+                rank=rank,
+                count=count
+            ))
         
         # 检查并解析玩家配置
         if "players" not in config_dict:
@@ -108,45 +103,21 @@ class SimpleGameConfig:
         if not isinstance(config_dict["players"], list):
             raise TypeError(f"'players' 必须是列表类型，实际类型: {type(config_dict['players'])}")
         
+        character_names = CharacterName.__members__
+        identities = PlayerIdentity.__members__
+        control_types = ControlType.__members__
         players_config = []
         for idx, player_data in enumerate(config_dict["players"]):
-            if not isinstance(player_data, dict):
-                raise TypeError(f"'players[{idx}]' 必须是字典类型，实际类型: {type(player_data)}")
-            
-            # 检查必需字段
-            if "name" not in player_data:
-                raise ValueError(f"'players[{idx}]' 缺少必需字段 'name'")
-            if "character_name" not in player_data:
-                raise ValueError(f"'players[{idx}]' 缺少必需字段 'character_name'")
-            if "identity" not in player_data:
-                raise ValueError(f"'players[{idx}]' 缺少必需字段 'identity'")
-            if "control_type" not in player_data:
-                raise ValueError(f"'players[{idx}]' 缺少必需字段 'control_type'")
-            
-            # 检查字段类型并转换枚举
-            if not isinstance(player_data["name"], str):
-                raise TypeError(f"'players[{idx}].name' 必须是字符串类型，实际类型: {type(player_data['name'])}")
-            
-            if not isinstance(player_data["character_name"], str):
-                raise TypeError(f"'players[{idx}].character_name' 必须是字符串类型，实际类型: {type(player_data['character_name'])}")
-            try:
-                character_name = CharacterName[player_data["character_name"]]
-            except KeyError:
-                raise ValueError(f"'players[{idx}].character_name' 无效的枚举值: {player_data['character_name']}")
-            
-            if not isinstance(player_data["identity"], str):
-                raise TypeError(f"'players[{idx}].identity' 必须是字符串类型，实际类型: {type(player_data['identity'])}")
             try:
-                identity = PlayerIdentity[player_data["identity"]]
-            except KeyError:
-                raise ValueError(f"'players[{idx}].identity' 无效的枚举值: {player_data['identity']}")
-            
-            if not isinstance(player_data["control_type"], str):
-                raise TypeError(f"'players[{idx}].control_type' 必须是字符串类型，实际类型: {type(player_data['control_type'])}")
-            try:
-                control_type = ControlType[player_data["control_type"]]
-            except KeyError:
-                raise ValueError(f"'players[{idx}].control_type' 无效的枚举值: {player_data['control_type']}")
+                if not isinstance(player_data["name"], str):
+                    raise TypeError
+                character_name = character_names[intern(player_data["character_name"])]
+                identity = identities[intern(player_data["identity"])]
+                control_type = control_types[intern(player_data["control_type"])]
+            except (KeyError, TypeError):
+                # 快速路径失败时再逐项校验，抛出带字段信息的异常
+                _check_player_data(idx, player_data)
+                raise
 
             # 可选字段：ai_difficulty（仅当 control_type=AI 时生效）
             ai_difficulty = None
@@ -202,33 +173,126 @@ class SimpleGameConfig:
             shuffle_deck=shuffle_deck
         )
     
+    @classmethod
+    def _from_trusted_dict(cls, config_dict: Dict[str, Any]) -> 'SimpleGameConfig':
+        """from_dict(validate=False) 的实现：信任字典结构，不做任何校验"""
+        card_names = CardName.__members__
+        card_suits = CardSuit.__members__
+        character_names = CharacterName.__members__
+        identities = PlayerIdentity.__members__
+        control_types = ControlType.__members__
+        return cls(
+            deck_config=[
+                SimpleCardConfig(card_names[c["name"]], card_suits[c["suit"]], c["rank"], c["count"])
+                for c in config_dict["deck"]
+            ],
+            players_config=[
+                SimplePlayerConfig(
+                    p["name"],
+                    character_names[p["character_name"]],
+                    identities[p["identity"]],
+                    control_types[p["control_type"]],
+                    p.get("ai_difficulty"),
+                )
+                for p in config_dict["players"]
+            ],
+            shuffle_deck=config_dict.get("game", {}).get("shuffle_deck", True),
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式
         
         Returns:
             配置字典
         """
+        players = []
+        for name, character_name, identity, control_type, ai_difficulty in map(_PLAYER_FIELDS, self.players_config):
+            player = {
+                "name": name,
+                "character_name": character_name,
+                "identity": identity,
+                "control_type": control_type,
+            }
+            if ai_difficulty:
+                player["ai_difficulty"] = ai_difficulty
+            players.append(player)
+        
         return {
             "deck": [
-                {
-                    "name": card.name.name,
-                    "suit": card.suit.name,
-                    "rank": card.rank,
-                    "count": card.count
-                }
-                for card in self.deck_config
-            ],
-            "players": [
-                {
-                    "name": player.name,
-                    "character_name": player.character_name.name,
-                    "identity": player.identity.name,
-                    "control_type": player.control_type.name,
-                    **({"ai_difficulty": player.ai_difficulty} if getattr(player, "ai_difficulty", None) else {}),
-                }
-                for player in self.players_config
+                {"name": name, "suit": suit, "rank": rank, "count": count}
+                for name, suit, rank, count in map(_CARD_FIELDS, self.deck_config)
             ],
+            "players": players,
             "game": {
                 "shuffle_deck": self.shuffle_deck
             }
         }
+
+
+def _check_card_data(idx: int, card_data: Any) -> None:
+    """逐项校验 deck[idx]，发现问题时抛出带字段信息的 TypeError/ValueError"""
+    if not isinstance(card_data, dict):
+        raise TypeError(f"'deck[{idx}]' 必须是字典类型，实际类型: {type(card_data)}")
+    
+    # 检查必需字段
+    if "name" not in card_data:
+        raise ValueError(f"'deck[{idx}]' 缺少必需字段 'name'")
+    if "suit" not in card_data:
+        raise ValueError(f"'deck[{idx}]' 缺少必需字段 'suit'")
+    if "rank" not in card_data:
+        raise ValueError(f"'deck[{idx}]' 缺少必需字段 'rank'")
+    if "count" not in card_data:
+        raise ValueError(f"'deck[{idx}]' 缺少必需字段 'count'")
+    
+    # 检查字段类型与枚举值
+    if not isinstance(card_data["name"], str):
+        raise TypeError(f"'deck[{idx}].name' 必须是字符串类型，实际类型: {type(card_data['name'])}")
+    if card_data["name"] not in CardName.__members__:
+        raise ValueError(f"'deck[{idx}].name' 无效的枚举值: {card_data['name']}")
+    
+    if not isinstance(card_data["suit"], str):
+        raise TypeError(f"'deck[{idx}].suit' 必须是字符串类型，实际类型: {type(card_data['suit'])}")
+    if card_data["suit"] not in CardSuit.__members__:
+        raise ValueError(f"'deck[{idx}].suit' 无效的枚举值: {card_data['suit']}")
+    
+    if not isinstance(card_data["rank"], int):
+        raise TypeError(f"'deck[{idx}].rank' 必须是整数类型，实际类型: {type(card_data['rank'])}")
+    
+    if not isinstance(card_data["count"], int):
+        raise TypeError(f"'deck[{idx}].count' 必须是整数类型，实际类型: {type(card_data['count'])}")
+
+
+def _check_player_data(idx: int, player_data: Any) -> None:
+    """逐项校验 players[idx]，发现问题时抛出带字段信息的 TypeError/ValueError"""
+    if not isinstance(player_data, dict):
+        raise TypeError(f"'players[{idx}]' 必须是字典类型，实际类型: {type(player_data)}")
+    
+    # 检查必需字段
+    if "name" not in player_data:
+        raise ValueError(f"'players[{idx}]' 缺少必需字段 'name'")
+    if "character_name" not in player_data:
+        raise ValueError(f"'players[{idx}]' 缺少必需字段 'character_name'")
+    if "identity" not in player_data:
+        raise ValueError(f"'players[{idx}]' 缺少必需字段 'identity'")
+    if "control_type" not in player_data:
+        raise ValueError(f"'players[{idx}]' 缺少必需字段 'control_type'")
+    
+    # 检查字段类型与枚举值
+    if not isinstance(player_data["name"], str):
+        raise TypeError(f"'players[{idx}].name' 必须是字符串类型，实际类型: {type(player_data['name'])}")
+    
+    if not isinstance(player_data["character_name"], str):
+        raise TypeError(f"'players[{idx}].character_name' 必须是字符串类型，实际类型: {type(player_data['character_name'])}")
+    if player_data["character_name"] not in CharacterName.__members__:
+        raise ValueError(f"'players[{idx}].character_name' 无效的枚举值: {player_data['character_name']}")
+    
+    if not isinstance(player_data["identity"], str):
+        raise TypeError(f"'players[{idx}].identity' 必须是字符串类型，实际类型: {type(player_data['identity'])}")
+    if player_data["identity"] not in PlayerIdentity.__members__:
+        raise ValueError(f"'players[{idx}].identity' 无效的枚举值: {player_data['identity']}")
+    
+    if not isinstance(player_data["control_type"], str):
+        raise TypeError(f"'players[{idx}].control_type' 必须是字符串类型，实际类型: {type(player_data['control_type'])}")
+    if player_data["control_type"] not in ControlType.__members__:
+        raise ValueError(f"'players[{idx}].control_type' 无效的枚举值: {player_data['control_type']}")
+
@@ -1,11 +1,16 @@
 # 简化的详细默认配置文件
 import json
 import os
-from typing import Dict, Any
+from itertools import islice, product
+from typing import Dict, Any, Tuple
 from .simple_card_config import SimpleGameConfig, SimpleCardConfig, SimplePlayerConfig
 from .enums import CardSuit, CardName, ControlType, PlayerIdentity, CharacterName
 
 
+# 已解析的配置文件：路径 -> (修改时间, 解析出的字典)。文件未改动时跳过读盘和 JSON 解析
+_parsed_config_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
 def load_config(config_file_name: str = "default_game_config") -> SimpleGameConfig:
     """加载配置文件
     
@@ -41,9 +46,16 @@ def load_config(config_file_name: str = "default_game_config") -> SimpleGameConf
             f"请确保 config_file/{file_name} 文件存在"
         )
     
-    # 从指定文件加载配置文件
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config_dict = json.load(f)
+    # 从指定文件加载配置文件（按修改时间缓存解析结果）
+    mtime = os.path.getmtime(config_path)
+    cached = _parsed_config_cache.get(config_path)
+    if cached is not None and cached[0] == mtime:
+        config_dict = cached[1]
+    else:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config_dict = json.load(f)
+        _parsed_config_cache[config_path] = (mtime, config_dict)
+    # 每次都构造新的配置对象：调用方（如训练脚本）会替换其中的玩家配置
     config = SimpleGameConfig.from_dict(config_dict)
     
     return config
@@ -60,142 +72,97 @@ def create_simple_default_game_config() -> SimpleGameConfig:
     return load_config("default_game_config")
 
 
+# 硬编码默认配置的牌堆与玩家，模块导入时构造一次；
+# SimpleCardConfig/SimplePlayerConfig 不可变，各次调用共享同一批实例，只复制外层列表
+
+# 基本牌：(牌名, 点数范围, 张数)。按点数从小到大，每个点数依次取 红桃/方块/梅花/黑桃，取满张数为止
+_BASIC_CARD_SPEC = (
+    (CardName.SHA, range(1, 9), 30),  # 杀 (30张)
+    (CardName.SHAN, range(2, 6), 15),  # 闪 (15张)
+    (CardName.TAO, range(1, 3), 8),  # 桃 (8张)
+)
+
+# 牌堆配置 - 只包含指定的牌
+_DEFAULT_DECK_TEMPLATE = tuple(
+    SimpleCardConfig(name, suit, rank, 1)
+    for name, ranks, total in _BASIC_CARD_SPEC
+    for rank, suit in islice(product(ranks, CardSuit), total)
+) + (
+    # 锦囊牌 - 无懈可击 (4张，每种花色点数组合1张)
+    SimpleCardConfig(CardName.WU_XIE_KE_JI, CardSuit.SPADES, 11, 1),
+    SimpleCardConfig(CardName.WU_XIE_KE_JI, CardSuit.CLUBS, 11, 1),
+    SimpleCardConfig(CardName.WU_XIE_KE_JI, CardSuit.SPADES, 12, 1),
+    SimpleCardConfig(CardName.WU_XIE_KE_JI, CardSuit.CLUBS, 12, 1),
+    
+    # # 锦囊牌 - 南蛮入侵 (3张，每种花色点数组合1张)
+    SimpleCardConfig(CardName.NAN_MAN_RU_QIN, CardSuit.SPADES, 7, 1),
+    SimpleCardConfig(CardName.NAN_MAN_RU_QIN, CardSuit.CLUBS, 7, 1),
+    SimpleCardConfig(CardName.NAN_MAN_RU_QIN, CardSuit.SPADES, 8, 1),
+    
+    # 锦囊牌 - 万箭齐发 (1张)
+    SimpleCardConfig(CardName.WAN_JIAN_QI_FA, CardSuit.HEARTS, 1, 1),
+    
+    # 锦囊牌 - 决斗 (3张)
+    SimpleCardConfig(CardName.JUE_DOU, CardSuit.SPADES, 1, 1),
+    SimpleCardConfig(CardName.JUE_DOU, CardSuit.CLUBS, 1, 1),
+    SimpleCardConfig(CardName.JUE_DOU, CardSuit.SPADES, 2, 1),
+    
+    # 装备牌 - 青釭剑 (1张)
+    SimpleCardConfig(CardName.QING_GANG_JIAN, CardSuit.SPADES, 6, 1),
+    
+    # 装备牌 - 诸葛连弩 (1张)
+    SimpleCardConfig(CardName.ZHU_GE_LIAN_NU, CardSuit.HEARTS, 7, 1),
+    
+    # 装备牌 - 仁王盾 (1张)
+    SimpleCardConfig(CardName.REN_WANG_DUN, CardSuit.SPADES, 2, 1),
+    
+    # 装备牌 - 进攻马 (1张)
+    SimpleCardConfig(CardName.JIN_GONG_MA, CardSuit.HEARTS, 5, 1),
+    
+    # 装备牌 - 防御马 (1张)
+    SimpleCardConfig(CardName.FANG_YU_MA, CardSuit.SPADES, 5, 1),
+)
+
+# 玩家配置
+_DEFAULT_PLAYERS_TEMPLATE = (
+    SimplePlayerConfig(
+        name="主公",
+        character_name=CharacterName.BAI_BAN_WU_JIANG,
+        identity=PlayerIdentity.LORD,
+        control_type=ControlType.AI
+    ),
+    SimplePlayerConfig(
+        name="忠臣",
+        character_name=CharacterName.GUAN_YU,
+        identity=PlayerIdentity.LOYALIST,
+        control_type=ControlType.AI
+    ),
+    SimplePlayerConfig(
+        name="反贼1",
+        character_name=CharacterName.ZHANG_FEI,
+        identity=PlayerIdentity.REBEL,
+        control_type=ControlType.AI
+    ),
+    SimplePlayerConfig(
+        name="反贼2",
+        character_name=CharacterName.LV_MENG,
+        identity=PlayerIdentity.REBEL,
+        control_type=ControlType.AI
+    ),
+    SimplePlayerConfig(
+        name="内奸",
+        character_name=CharacterName.BAI_BAN_WU_JIANG,
+        identity=PlayerIdentity.TRAITOR,
+        control_type=ControlType.AI
+    ),
+)
+
+
 #TODO 可以修改成使用工厂模式
 def create_hardcoded_default_game_config() -> SimpleGameConfig:
     """创建简化的默认游戏配置"""
-    
-    # 牌堆配置 - 只包含指定的牌
-    deck_config = [
-        # 基本牌 - 杀 (30张，每种花色点数组合1张)
-        SimpleCardConfig(CardName.SHA, CardSuit.HEARTS, 1, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.DIAMONDS, 1, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.CLUBS, 1, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.SPADES, 1, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.HEARTS, 2, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.DIAMONDS, 2, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.CLUBS, 2, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.SPADES, 2, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.HEARTS, 3, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.DIAMONDS, 3, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.CLUBS, 3, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.SPADES, 3, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.HEARTS, 4, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.DIAMONDS, 4, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.CLUBS, 4, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.SPADES, 4, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.HEARTS, 5, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.DIAMONDS, 5, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.CLUBS, 5, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.SPADES, 5, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.HEARTS, 6, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.DIAMONDS, 6, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.CLUBS, 6, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.SPADES, 6, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.HEARTS, 7, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.DIAMONDS, 7, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.CLUBS, 7, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.SPADES, 7, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.HEARTS, 8, 1),
-        SimpleCardConfig(CardName.SHA, CardSuit.DIAMONDS, 8, 1),
-        
-        # 基本牌 - 闪 (15张，每种花色点数组合1张)
-        SimpleCardConfig(CardName.SHAN, CardSuit.HEARTS, 2, 1),
-        SimpleCardConfig(CardName.SHAN, CardSuit.DIAMONDS, 2, 1),
-        SimpleCardConfig(CardName.SHAN, CardSuit.CLUBS, 2, 1),
-        SimpleCardConfig(CardName.SHAN, CardSuit.SPADES, 2, 1),
-        SimpleCardConfig(CardName.SHAN, CardSuit.HEARTS, 3, 1),
-        SimpleCardConfig(CardName.SHAN, CardSuit.DIAMONDS, 3, 1),
-        SimpleCardConfig(CardName.SHAN, CardSuit.CLUBS, 3, 1),
-        SimpleCardConfig(CardName.SHAN, CardSuit.SPADES, 3, 1),
-        SimpleCardConfig(CardName.SHAN, CardSuit.HEARTS, 4, 1),
-        SimpleCardConfig(CardName.SHAN, CardSuit.DIAMONDS, 4, 1),
-        SimpleCardConfig(CardName.SHAN, CardSuit.CLUBS, 4, 1),
-        SimpleCardConfig(CardName.SHAN, CardSuit.SPADES, 4, 1),
-        SimpleCardConfig(CardName.SHAN, CardSuit.HEARTS, 5, 1),
-        SimpleCardConfig(CardName.SHAN, CardSuit.DIAMONDS, 5, 1),
-        SimpleCardConfig(CardName.SHAN, CardSuit.CLUBS, 5, 1),
-        
-        # 基本牌 - 桃 (8张，每种花色点数组合1张)
-        SimpleCardConfig(CardName.TAO, CardSuit.HEARTS, 1, 1),
-        SimpleCardConfig(CardName.TAO, CardSuit.DIAMONDS, 1, 1),
-        SimpleCardConfig(CardName.TAO, CardSuit.CLUBS, 1, 1),
-        SimpleCardConfig(CardName.TAO, CardSuit.SPADES, 1, 1),
-        SimpleCardConfig(CardName.TAO, CardSuit.HEARTS, 2, 1),
-        SimpleCardConfig(CardName.TAO, CardSuit.DIAMONDS, 2, 1),
-        SimpleCardConfig(CardName.TAO, CardSuit.CLUBS, 2, 1),
-        SimpleCardConfig(CardName.TAO, CardSuit.SPADES, 2, 1),
-        
-        # 锦囊牌 - 无懈可击 (4张，每种花色点数组合1张)
-        SimpleCardConfig(CardName.WU_XIE_KE_JI, CardSuit.SPADES, 11, 1),
-        SimpleCardConfig(CardName.WU_XIE_KE_JI, CardSuit.CLUBS, 11, 1),
-        SimpleCardConfig(CardName.WU_XIE_KE_JI, CardSuit.SPADES, 12, 1),
-        SimpleCardConfig(CardName.WU_XIE_KE_JI, CardSuit.CLUBS, 12, 1),
-        
-        # # 锦囊牌 - 南蛮入侵 (3张，每种花色点数组合1张)
-        SimpleCardConfig(CardName.NAN_MAN_RU_QIN, CardSuit.SPADES, 7, 1),
-        SimpleCardConfig(CardName.NAN_MAN_RU_QIN, CardSuit.CLUBS, 7, 1),
-        SimpleCardConfig(CardName.NAN_MAN_RU_QIN, CardSuit.SPADES, 8, 1),
-        
-        # 锦囊牌 - 万箭齐发 (1张)
-        SimpleCardConfig(CardName.WAN_JIAN_QI_FA, CardSuit.HEARTS, 1, 1),
-        
-        # 锦囊牌 - 决斗 (3张)
-        SimpleCardConfig(CardName.JUE_DOU, CardSuit.SPADES, 1, 1),
-        SimpleCardConfig(CardName.JUE_DOU, CardSuit.CLUBS, 1, 1),
-        SimpleCardConfig(CardName.JUE_DOU, CardSuit.SPADES, 2, 1),
-        
-        # 装备牌 - 青釭剑 (1张)
-        SimpleCardConfig(CardName.QING_GANG_JIAN, CardSuit.SPADES, 6, 1),
-        
-        # 装备牌 - 诸葛连弩 (1张)
-        SimpleCardConfig(CardName.ZHU_GE_LIAN_NU, CardSuit.HEARTS, 7, 1),
-        
-        # 装备牌 - 仁王盾 (1张)
-        SimpleCardConfig(CardName.REN_WANG_DUN, CardSuit.SPADES, 2, 1),
-        
-        # 装备牌 - 进攻马 (1张)
-        SimpleCardConfig(CardName.JIN_GONG_MA, CardSuit.HEARTS, 5, 1),
-        
-        # 装备牌 - 防御马 (1张)
-        SimpleCardConfig(CardName.FANG_YU_MA, CardSuit.SPADES, 5, 1),
-    ]
-    
-    # 玩家配置
-    players_config = [
-        SimplePlayerConfig(
-            name="主公",
-            character_name=CharacterName.BAI_BAN_WU_JIANG,
-            identity=PlayerIdentity.LORD,
-            control_type=ControlType.AI
-        ),
-        SimplePlayerConfig(
-            name="忠臣",
-            character_name=CharacterName.GUAN_YU,
-            identity=PlayerIdentity.LOYALIST,
-            control_type=ControlType.AI
-        ),
-        SimplePlayerConfig(
-            name="反贼1",
-            character_name=CharacterName.ZHANG_FEI,
-            identity=PlayerIdentity.REBEL,
-            control_type=ControlType.AI
-        ),
-        SimplePlayerConfig(
-            name="反贼2",
-            character_name=CharacterName.LV_MENG,
-            identity=PlayerIdentity.REBEL,
-            control_type=ControlType.AI
-        ),
-        SimplePlayerConfig(
-            name="内奸",
-            character_name=CharacterName.BAI_BAN_WU_JIANG,
-            identity=PlayerIdentity.TRAITOR,
-            control_type=ControlType.AI
-        )
-    ]
-    
     return SimpleGameConfig(
-        deck_config=deck_config,
-        players_config=players_config,
+        deck_config=list(_DEFAULT_DECK_TEMPLATE),
+        players_config=list(_DEFAULT_PLAYERS_TEMPLATE),
         shuffle_deck=True
-    )
\ No newline at end of file
+    )
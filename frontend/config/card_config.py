@@ -1,13 +1,7 @@
+from typing import NamedTuple
 from config.enums import CardSuit, CardName
-class CardConfig:
+class CardConfig(NamedTuple):
+    """前端牌面信息（不可变）：相等比较与哈希都在 C 层按元组完成"""
     name: CardName  # 牌名
     suit: CardSuit  # 花色
     rank: int  # 点数
-    def __init__(self, card_name: CardName, suit: CardSuit, rank: int):
-        self.name = card_name
-        self.suit = suit
-        self.rank = rank
-    def __eq__(self, other):
-        if not isinstance(other, CardConfig):
-            return False
-        return self.name == other.name and self.suit == other.suit and self.rank == other.rank
\ No newline at end of file
@@ -1,4 +1,6 @@
 
+import math
+
 import pygame
 from frontend.ui.card_sprite import CardSprite
 from frontend.core.renderer import Renderer
@@ -9,13 +11,18 @@ from frontend.core.game_state import game_state, GameStateEnum
 DEFAULT_ANIM_SPEED = 30  # 每帧移动像素数
 PLAY_CARD_ANIM_SPEED = 30
 class Animation:
+    __slots__ = ("sprite", "target_pos", "is_complete", "on_complete", "speed_sq")
+
     def __init__(self, sprite: CardSprite, target_pos: tuple,  on_complete=None):
         self.sprite = sprite
         self.target_pos = target_pos
         self.is_complete = False
         # 结束后的回调函数类型应该是什么
         self.on_complete = on_complete if on_complete else lambda: None
+        self.speed_sq = sprite.anim_speed * sprite.anim_speed  # 到达判定用平方距离比较，免开方
 class Effect:
+    __slots__ = ("sprite", "duration_frames", "on_complete")
+
     def __init__(self, sprite: EffectSprite | CardSprite, duration_frames: int, on_complete=None):
         self.sprite = sprite
         self.duration_frames = duration_frames
@@ -27,6 +34,10 @@ class AnimationManager:
         self.active_animations = []
         self.show_effects = []
 
+    def has_active(self) -> bool:
+        """是否还有未结束的动画或特效"""
+        return bool(self.active_animations or self.show_effects)
+
     def add_draw_card_animation(self, card_config: CardConfig, to_pos: tuple, face_up = True, on_complete=None):
         game_state.set_state(GameStateEnum.ANIMATING)
         start_pos = self.renderer.deck_center_pos
@@ -61,43 +72,47 @@ class AnimationManager:
     def add_effect(self, effect_code: EffectName, pos: tuple, duration_frames=60, on_complete=None):
         game_state.set_state(GameStateEnum.ANIMATING)
         effect_sprite = EffectSprite(pos, effect_code, asset_mgr=self.renderer.asset_mgr)
+        effect_sprite.dirty = 2  # 静止展示期间每帧都需重绘（背景整屏重铺），设为常驻脏标记
         self.renderer.add_sprite(effect_sprite)
         self.show_effects.append(Effect(effect_sprite, duration_frames, on_complete))
 
     def add_show_card(self, card_config: CardConfig, pos: tuple, duration_frames=60, on_complete=None):
         game_state.set_state(GameStateEnum.ANIMATING)
         card_sprite = CardSprite(pos, card_config, face_up=True, speed=0, asset_mgr=self.renderer.asset_mgr)
+        card_sprite.dirty = 2  # 同上
         self.renderer.add_sprite(card_sprite)
         self.show_effects.append(Effect(card_sprite, duration_frames, on_complete))
 
     def update(self):
-        for anim in self.active_animations[:]:
+        # 取出当前列表并换成新列表，存活的重新放回：整体 O(N)，不再逐个 remove/index。
+        # on_complete 回调可能追加新的动画/特效，它们直接进入新列表。
+        animations = self.active_animations
+        self.active_animations = []
+        for anim in animations:
             sprite = anim.sprite
             if sprite.is_animating:
                 tx, ty = sprite.anim_target
                 cx, cy = sprite.rect.center
                 dx, dy = tx - cx, ty - cy
-                dist = (dx**2 + dy**2)**0.5
-                if dist < sprite.anim_speed:
+                dist_sq = dx * dx + dy * dy
+                if dist_sq < anim.speed_sq:
                     sprite.rect.center = sprite.anim_target
                     sprite.is_animating = False
-                    self.active_animations.remove(anim)
                     self.renderer.remove_sprite(sprite)
                     anim.on_complete()
-                else:
-                    move_x = sprite.anim_speed * dx / dist
-                    move_y = sprite.anim_speed * dy / dist
-                    sprite.rect.center = (cx + move_x, cy + move_y)
-                    sprite.dirty = 1  # Mark as dirty for redraw
-        for effect in self.show_effects[:]:
-            effect_sprite, frames_left = effect.sprite, effect.duration_frames
-            frames_left -= 1
-            if frames_left <= 0:
-                self.renderer.remove_sprite(effect_sprite)
-                self.show_effects.remove(effect)
+                    continue
+                step = sprite.anim_speed / math.sqrt(dist_sq)  # 一次除法，x/y 两个分量都用乘法
+                sprite.rect.center = (cx + dx * step, cy + dy * step)
+                sprite.dirty = 1  # Mark as dirty for redraw
+            self.active_animations.append(anim)
+
+        effects = self.show_effects
+        self.show_effects = []
+        for effect in effects:
+            effect.duration_frames -= 1
+            if effect.duration_frames <= 0:
+                self.renderer.remove_sprite(effect.sprite)
                 if effect.on_complete:
                     effect.on_complete()
             else:
-                index = self.show_effects.index(effect)
-                effect_sprite.dirty = 1  # Mark as dirty for redraw
-                self.show_effects[index] = (Effect(effect_sprite, frames_left, effect.on_complete))
\ No newline at end of file
+                self.show_effects.append(effect)
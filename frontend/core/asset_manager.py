@@ -1,8 +1,29 @@
+import io
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 import pygame
 from config.enums import CardName, CharacterName, EffectName, PlayerIdentity
+from config.simple_card_config import SimpleGameConfig
 from frontend.util.size import CARD_SIZE
 
+logger = logging.getLogger(__name__)
+
+# 身份 -> 死亡特效图片名（dead_<id>.png）中的标识
+_DEATH_EFFECT_ID = {
+    PlayerIdentity.LORD: "zhugong",
+    PlayerIdentity.LOYALIST: "zhongchen",
+    PlayerIdentity.REBEL: "fanzei",
+    PlayerIdentity.TRAITOR: "neijian",
+}
+
+
+def _read_bytes(path: str) -> bytes:
+    """读取整个文件（prewarm 线程池中执行）"""
+    with open(path, "rb") as f:
+        return f.read()
+
 
 def _fit_to_box(src: pygame.Surface, box_size: tuple[int, int]) -> pygame.Surface:
     """等比缩放并居中裁剪到固定框（cover）。
@@ -16,24 +37,49 @@ def _fit_to_box(src: pygame.Surface, box_size: tuple[int, int]) -> pygame.Surfac
     """
     bw, bh = box_size
     sw, sh = src.get_size()
+    # 源图不带逐像素 alpha（JPG）时输出也用不透明的显示格式，blit 时不做混合
+    flags = src.get_flags() & pygame.SRCALPHA
 
     if sw <= 0 or sh <= 0:
-        return pygame.Surface((bw, bh), pygame.SRCALPHA)
+        return pygame.Surface((bw, bh), flags)
 
     # cover：保证至少铺满框，超出部分裁掉
     scale = max(bw / sw, bh / sh)
     nw, nh = int(sw * scale), int(sh * scale)
-    scaled = pygame.transform.smoothscale(src, (nw, nh))
+    # 大幅缩小时先逐次减半到目标的 4 倍以内，最后一步再缩放到目标尺寸。
+    # 减半同样用 smoothscale（2x2 取平均），不用最近邻的 scale：后者每步丢掉 3/4 像素，细节多的立绘会出锯齿
+    while sw // 2 >= 2 * nw and sh // 2 >= 2 * nh:
+        sw, sh = sw // 2, sh // 2
+        src = pygame.transform.smoothscale(src, (sw, sh))
+    # 牌面素材已是 CARD_SIZE，尺寸相同时无需缩放
+    scaled = src if (sw, sh) == (nw, nh) else pygame.transform.smoothscale(src, (nw, nh))
 
-    out = pygame.Surface((bw, bh), pygame.SRCALPHA)
+    out = pygame.Surface((bw, bh), flags)
     x = (bw - nw) // 2
     y = (bh - nh) // 2
     out.blit(scaled, (x, y))
     return out
 
 class AssetManager:
+    """图像资源加载与缓存。
+
+    牌面/武将/牌堆为 JPG，用 convert() 转为不透明的显示格式；特效为 PNG，保留 convert_alpha()。
+    """
+
     def __init__(self, asset_root=None):
-        self._cache = {}
+        # 按类别分开缓存，直接以枚举成员为键：命中时不用构造元组键
+        self._cards: dict[CardName, pygame.Surface] = {}
+        self._characters: dict[CharacterName, pygame.Surface] = {}
+        self._effects: dict[EffectName, pygame.Surface] = {}
+        self._death_effects: dict[PlayerIdentity, pygame.Surface] = {}
+        self._card_back: pygame.Surface | None = None
+        self._deck: pygame.Surface | None = None
+        # 缺图时的占位图：同尺寸同颜色共用一个 Surface（只读使用）
+        self._placeholders: dict[tuple, pygame.Surface] = {}
+        # 已提示过缺失的图片路径（每个路径只警告一次）
+        self._missing_paths: set[str] = set()
+        # prewarm 期间并行预读的图片文件内容：路径 -> 字节
+        self._prefetched: dict[str, bytes] = {}
 
         if asset_root is None:
             asset_root = os.path.join("frontend", "assets")
@@ -43,110 +89,185 @@ class AssetManager:
         self.character_base_path = os.path.join(asset_root, "characters")
         self.effect_base_path = os.path.join(asset_root, "effects")
 
+    def prewarm(self, config: SimpleGameConfig) -> None:
+        """预先加载本局会用到的全部图像，避免首次绘制时在帧循环里读盘、解码、缩放。
+
+        只加载配置中出现的牌、武将和身份（未配置的牌没有对应图片）。
+        需在 pygame.display.set_mode 之后、在显示线程中调用。
+
+        文件先由线程池并行读入内存，解码、convert 和缩放仍在当前线程依次完成。
+
+        Args:
+            config: 本局游戏配置。
+        """
+        paths = [path for path in self._prewarm_paths(config) if os.path.exists(path)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            self._prefetched = dict(zip(paths, pool.map(_read_bytes, paths)))
+
+        try:
+            self._prewarm_surfaces(config)
+        finally:
+            self._prefetched = {}
+
+    def _prewarm_paths(self, config: SimpleGameConfig) -> set[str]:
+        """本局会用到的图片路径，与 _prewarm_surfaces 加载的图像一一对应"""
+        paths = {self._card_back_path(), self._deck_path()}
+        paths.update(self._card_path(card.name) for card in config.deck_config)
+        for player in config.players_config:
+            paths.add(self._character_path(player.character_name))
+            paths.add(self._death_effect_path(player.identity))
+        paths.update(self._effect_path(effect_name) for effect_name in EffectName)
+        return paths
+
+    def _card_path(self, code: CardName) -> str:
+        return os.path.join(self.card_base_path, f"{code.value}.jpg")
+
+    def _card_back_path(self) -> str:
+        return os.path.join(self.card_base_path, "back.jpg")
+
+    def _deck_path(self) -> str:
+        return os.path.join(self.card_base_path, "deck.jpg")
+
+    def _character_path(self, code: CharacterName) -> str:
+        return os.path.join(self.character_base_path, f"{code.value}.jpg")
+
+    def _effect_path(self, code: EffectName) -> str:
+        return os.path.join(self.effect_base_path, f"{code.value}.png")
+
+    def _death_effect_path(self, identity: PlayerIdentity) -> str:
+        return os.path.join(self.effect_base_path, f"dead_{_DEATH_EFFECT_ID[identity]}.png")
+
+    def _prewarm_surfaces(self, config: SimpleGameConfig) -> None:
+        """依次调用各 getter，把本局用到的图像放入缓存"""
+        self.get_card_back()
+        self.get_deck_surface()
+        for card_name in {card.name for card in config.deck_config}:
+            self.get_card_surface(card_name)
+        for player in config.players_config:
+            self.get_character_surface(player.character_name)
+            self.get_death_effect_surface(player.identity)
+        for effect_name in EffectName:
+            self.get_effect_surface(effect_name)
+
     def get_card_surface(self, code: CardName) -> pygame.Surface:
-        key = ("card", code.value)
-        if key in self._cache:
-            return self._cache[key]
+        surf = self._cards.get(code)
+        if surf is not None:
+            return surf
 
-        filename = f"{code.value}.jpg"
-        path = os.path.join(self.card_base_path, filename)
+        path = self._card_path(code)
 
-        surf = pygame.image.load(path).convert_alpha()
-        surf = _fit_to_box(surf, CARD_SIZE)
+        if os.path.exists(path):
+            surf = self._load_image(path).convert()
+            surf = _fit_to_box(surf, CARD_SIZE)
+        else:
+            # prewarm 在 Renderer 初始化时加载全部牌面：缺图不能让客户端起不来
+            surf = self._placeholder(path, CARD_SIZE, (180, 180, 180))
 
-        self._cache[key] = surf
+        self._cards[code] = surf
         return surf
 
     def get_card_back(self) -> pygame.Surface:
-        key = ("card", "back")
-        if key in self._cache:
-            return self._cache[key]
+        if self._card_back is not None:
+            return self._card_back
 
-        path = os.path.join(self.card_base_path, "back.jpg")
+        path = self._card_back_path()
         if os.path.exists(path):
-            surf = pygame.image.load(path).convert_alpha()
+            surf = self._load_image(path).convert()
         else:
-            # 占位图
-            surf = pygame.Surface((100, 150))
-            surf.fill((180, 180, 180))
-        self._cache[key] = surf
+            surf = self._placeholder(path, (100, 150), (180, 180, 180))
+        self._card_back = surf
         return surf
 
     def get_deck_surface(self) -> pygame.Surface:
         """
         返回牌堆图像的 Surface 对象
         """
-        key = ("card", "deck")
-        if key in self._cache:
-            return self._cache[key]
+        if self._deck is not None:
+            return self._deck
 
-        path = os.path.join(self.card_base_path, "deck.jpg")
-        surf = pygame.image.load(path).convert_alpha()
-        self._cache[key] = surf
+        path = self._deck_path()
+        if os.path.exists(path):
+            surf = self._load_image(path).convert()
+        else:
+            surf = self._placeholder(path, (100, 150), (180, 180, 180))
+        self._deck = surf
         return surf
 
     def get_character_surface(self, code: CharacterName) -> pygame.Surface:
-        key = ("character", code.value)
-        if key in self._cache:
-            return self._cache[key]
+        surf = self._characters.get(code)
+        if surf is not None:
+            return surf
 
-        filename = f"{code.value}.jpg"
-        path = os.path.join(self.character_base_path, filename)
+        path = self._character_path(code)
 
         if os.path.exists(path):
-            surf = pygame.image.load(path).convert_alpha()
+            surf = self._load_image(path).convert()
             surf = _fit_to_box(surf, CARD_SIZE)  # 关键：统一尺寸
         else:
             # 占位图也做成统一尺寸
-            surf = pygame.Surface(CARD_SIZE, pygame.SRCALPHA)
-            surf.fill((180, 180, 180))
+            surf = self._placeholder(path, CARD_SIZE, (180, 180, 180))
 
-        self._cache[key] = surf
+        self._characters[code] = surf
         return surf
 
     def get_effect_surface(self, code: EffectName) -> pygame.Surface:
-        key = ("effect", code.value)
-        if key in self._cache:
-            return self._cache[key]
+        surf = self._effects.get(code)
+        if surf is not None:
+            return surf
 
-        filename = f"{code.value}.png"
-        path = os.path.join(self.effect_base_path, filename)
+        path = self._effect_path(code)
 
         if os.path.exists(path):
-            surf = pygame.image.load(path).convert_alpha()
+            surf = self._load_image(path).convert_alpha()
         else:
-            # 占位图
-            surf = pygame.Surface((100, 100))
-            surf.fill((255, 0, 0))
+            surf = self._placeholder(path, (100, 100), (255, 0, 0))
 
-        self._cache[key] = surf
+        self._effects[code] = surf
         return surf
     
     def get_death_effect_surface(self, identity: PlayerIdentity) -> pygame.Surface:
         """
         根据玩家身份获取死亡特效图像
         """
-        if identity == PlayerIdentity.LORD:
-            id_str = "zhugong"
-        elif identity == PlayerIdentity.LOYALIST:
-            id_str = "zhongchen"
-        elif identity == PlayerIdentity.REBEL:
-            id_str = "fanzei"
-        elif identity == PlayerIdentity.TRAITOR:
-            id_str = "neijian"
-        key = ("effect", f"death_{id_str}")
-        if key in self._cache:
-            return self._cache[key]
-
-        filename = f"dead_{id_str}.png"
-        path = os.path.join(self.effect_base_path, filename)
+        surf = self._death_effects.get(identity)
+        if surf is not None:
+            return surf
+
+        path = self._death_effect_path(identity)
 
         if os.path.exists(path):
-            surf = pygame.image.load(path).convert_alpha()
+            surf = self._load_image(path).convert_alpha()
         else:
-            # 占位图
-            surf = pygame.Surface((100, 100))
-            surf.fill((0, 0, 0))
+            surf = self._placeholder(path, (100, 100), (0, 0, 0))
+
+        self._death_effects[identity] = surf
+        return surf
 
-        self._cache[key] = surf
+    def _placeholder(self, path: str, size: tuple[int, int], color: tuple[int, int, int]) -> pygame.Surface:
+        """返回缺图时的纯色占位图，相同尺寸和颜色的占位图只创建一次。
+
+        Args:
+            path: 缺失的图片路径（仅用于提示）。
+            size: 占位图尺寸。
+            color: 填充颜色。
+
+        Returns:
+            共享的占位 Surface，调用方不得修改。
+        """
+        if path not in self._missing_paths:
+            self._missing_paths.add(path)
+            logger.warning("缺少图片资源，使用占位图: %s", path)
+        key = (size, color)
+        surf = self._placeholders.get(key)
+        if surf is None:
+            surf = pygame.Surface(size)
+            surf.fill(color)
+            self._placeholders[key] = surf
         return surf
+
+    def _load_image(self, path: str) -> pygame.Surface:
+        """加载图片；prewarm 已预读的文件直接从内存解码，不再读盘"""
+        data = self._prefetched.pop(path, None)
+        if data is None:
+            return pygame.image.load(path)
+        return pygame.image.load(io.BytesIO(data), path)
@@ -4,18 +4,52 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "."))
 
 import pygame
-import threading
-import queue
-from typing import Optional, Dict, Any, Iterable, List
+from functools import lru_cache, partial
+from typing import Optional, Dict, Any, Callable, Iterable, List, Set
 
-from config.enums import EffectName, CardName, EquipmentType, EquipmentName
+from config.enums import EffectName, CardName, CardSuit, EquipmentType, EquipmentName
 from frontend.core.renderer import Renderer
 from frontend.core.animation_manager import AnimationManager
-from config.simple_card_config import SimpleGameConfig
+from config.simple_card_config import SimpleGameConfig, SimpleCardConfig
 from frontend.config.card_config import CardConfig
 from frontend.core.game_state import game_state, GameStateEnum
 from communicator.communicator import communicator, AckEvent
-from communicator.comm_event import InputRequestEvent, InputResponseEvent
+from communicator.comm_event import (InputRequestEvent, InputResponseEvent, DrawCardEvent, PlayCardEvent,
+                                     HPChangeEvent, DiscardCardEvent, EquipChangeEvent, DeathEvent)
+
+# 后端有新事件时（在后端线程中）投递的唤醒事件：空闲时主循环阻塞在 pygame.event.wait 上，靠它立即醒来
+_BACKEND_WAKEUP_EVENT = pygame.USEREVENT
+# 空闲时单次等待 pygame 事件的上限（毫秒）；正常由唤醒事件打断，超时只是兜底复查后端队列
+_IDLE_WAIT_MS = 500
+
+# 装备牌的牌名取值（弃装备区的牌不减手牌数）
+_EQUIPMENT_VALUES = frozenset(e.value for e in EquipmentName)
+
+# 输入请求 action -> 输入面板标题
+_ACTION_TITLES = {
+    "select_card": "出牌阶段",
+    "select_targets": "选择目标",
+    "discard": "弃牌阶段",
+    "ask_use_card_response": "回合外响应",
+    "ask_activate_skill": "技能询问",
+}
+
+# 对目标出牌时在目标角色上播放的命中特效（不在表中的牌只展示牌面）
+_CARD_HIT_EFFECTS = {
+    CardName.SHA: EffectName.HURT,
+    CardName.JUE_DOU: EffectName.BOOM,
+}
+
+
+@lru_cache(maxsize=256)
+def _card_config(name: CardName, suit: CardSuit, rank: int) -> CardConfig:
+    """按 (牌名, 花色, 点数) 复用 CardConfig：牌堆里不同的牌有限，CardConfig 不可变，可安全共享。"""
+    return CardConfig(name=name, suit=suit, rank=rank)
+
+
+def _to_card_config(simple_card_cfg: SimpleCardConfig) -> CardConfig:
+    """后端事件中的 SimpleCardConfig -> 前端 CardConfig。"""
+    return _card_config(simple_card_cfg.name, simple_card_cfg.suit, simple_card_cfg.rank)
 
 
 class GameClient:
@@ -51,24 +85,61 @@ class GameClient:
 
         # 当前等待玩家输入的请求（若为 None 表示不在选择中）
         self.pending_input_request: Optional[InputRequestEvent] = None
+        # 收到请求时解析一次的字段，帧循环/点击处理直接读取
+        self._req_action: str = ""
+        self._req_prompt: str = ""
+        self._req_options: Dict[str, Any] = {}
+        self._req_targets: Set[int] = set()
 
         # 选择缓存（只选中，不直接提交；提交由“确认”按钮触发）
         self.selected_target_ids: List[int] = []
         self.selected_card_index: Optional[int] = None
 
-        # 弃牌多选
-        self.selected_discard_indices: List[int] = []
+        # 弃牌多选（只在提交时才需要顺序，用集合做 O(1) 的切换）
+        self.selected_discard_indices: Set[int] = set()
         self._discard_need_count: int = 0
         self._discard_min_count: int = 0
         self._discard_allow_less: bool = False
 
+        # PlayerView 索引（玩家 ID -> PlayerView、自己的 PlayerView），
+        # 及其对应的 Renderer.player_views 对象与长度；两者变化时重建
+        self._pv_by_id: Dict[int, Any] = {}
+        self._self_pv: Optional[Any] = None
+        self._pv_source: Optional[Any] = None
+        self._pv_count: int = -1
+
         # UI：输入面板按钮区域（由 Renderer.draw_input_panel 返回）
         self._ui_buttons: Dict[str, pygame.Rect] = {}
 
-        # 后端事件接收：线程 + 队列（关键：不管动画/选择都必须收包，否则会漏响应请求）
-        self._stop_event = threading.Event()
-        self._evt_queue: "queue.Queue[Any]" = queue.Queue()
-        self._recv_thread: Optional[threading.Thread] = None
+        # 后端事件类型 -> 处理方法（按类型查表，代替逐个比较类名）
+        # 处理方法返回是否已发出 ACK（或已交给动画结束回调发出），见 _handle_backend_event
+        self._event_handlers: Dict[type, Callable[[Any], bool]] = {
+            DrawCardEvent: self._on_draw_card,
+            PlayCardEvent: self._on_play_card,
+            HPChangeEvent: self._on_hp_change,
+            DiscardCardEvent: self._on_discard_card,
+            EquipChangeEvent: self._on_equip_change,
+            DeathEvent: self._on_death,
+            InputRequestEvent: self._on_input_request,
+        }
+
+        # SELECTING 状态的快捷键：与 action 无关的按键，以及只在特定 action 下生效的按键
+        # ESC：按 action 区分语义（响应/技能：直接否决；其它：清空选择）；回车：等价于点击“确认”
+        self._selecting_key_handlers: Dict[int, Callable[[], None]] = {
+            pygame.K_ESCAPE: self._handle_cancel,
+            pygame.K_RETURN: self._submit_confirm,
+            pygame.K_KP_ENTER: self._submit_confirm,
+        }
+        # Y/N：技能询问快捷键；退格：清空弃牌选择
+        self._action_key_handlers: Dict[str, Dict[int, Callable[[], None]]] = {
+            "ask_activate_skill": {
+                pygame.K_y: partial(self._submit_input_response, {"activate": True}),
+                pygame.K_n: partial(self._submit_input_response, {"activate": False}),
+            },
+            "discard": {
+                pygame.K_BACKSPACE: self.selected_discard_indices.clear,  # 该集合只原地清空，不会被重新赋值
+            },
+        }
 
     # -------------------------
     # PlayerView 兼容访问（list / dict）
@@ -90,8 +161,30 @@ class GameClient:
             return pvs.values()
         return pvs
 
+    def _sync_player_view_index(self) -> None:
+        """Renderer.player_views 被替换或增删后，重建按 ID 的索引和自己的 PlayerView。
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pvs = getattr(self.renderer, "player_views", None)
+        count = -1 if pvs is None else len(pvs)
+        if pvs is self._pv_source and count == self._pv_count:
+            return
+        self._pv_source = pvs
+        self._pv_count = count
+        self._pv_by_id = {}
+        self._self_pv = None
+        for pv in self._iter_player_views():
+            self._pv_by_id[getattr(pv, "id", None)] = pv
+            if self._self_pv is None and getattr(pv, "is_self", False):
+                self._self_pv = pv
+
     def _get_player_view(self, player_id: int) -> Optional[Any]:
-        """按玩家 ID 获取 PlayerView，兼容 dict / list。
+        """按玩家 ID 获取 PlayerView（查索引，不依赖 list 下标与 ID 一致）。
 
         Args:
             player_id: 玩家 ID。
@@ -99,14 +192,8 @@ class GameClient:
         Returns:
             对应的 PlayerView；若不存在则返回 None。
         """
-        pvs = getattr(self.renderer, "player_views", None)
-        if pvs is None:
-            return None
-        if isinstance(pvs, dict):
-            return pvs.get(player_id)
-        if isinstance(player_id, int) and 0 <= player_id < len(pvs):
-            return pvs[player_id]
-        return None
+        self._sync_player_view_index()
+        return self._pv_by_id.get(player_id)
 
     def _get_self_player_view(self) -> Optional[Any]:
         """获取自己的 PlayerView（is_self=True）。
@@ -117,52 +204,60 @@ class GameClient:
         Returns:
             自己的 PlayerView；若不存在则返回 None。
         """
-        for pv in self._iter_player_views():
-            if getattr(pv, "is_self", False):
-                return pv
-        return None
+        self._sync_player_view_index()
+        return self._self_pv
 
     # -------------------------
-    # 后端事件接收：线程/队列
+    # 后端事件接收：主循环每帧直接从 communicator 取（关键：不管动画/选择都必须收包，否则会漏响应请求）
     # -------------------------
 
-    def _recv_loop(self) -> None:
-        """后台接收线程：持续从后端收事件并放入队列。
+    @staticmethod
+    def _wake_main_loop() -> None:
+        """communicator 的入队通知：向 SDL 事件队列投递唤醒事件（SDL 事件队列自带锁，可跨线程投递）。"""
+        try:
+            pygame.event.post(pygame.event.Event(_BACKEND_WAKEUP_EVENT))
+        except pygame.error:
+            pass  # 显示已关闭
 
-        Args:
-            None
-
-        Returns:
-            None
-        """
-        while not self._stop_event.is_set():
-            try:
-                ev = communicator.receive_from_backend()
-            except Exception:
-                ev = None
-            if ev is not None:
-                self._evt_queue.put(ev)
-            else:
-                pygame.time.wait(5)
-
-    def _drain_backend_events(self) -> None:
+    def _drain_backend_events(self) -> bool:
         """每帧把队列里的后端事件尽量取空并处理。
 
+        同一玩家的多条 HPChangeEvent 只保留最后一条（留在它原来的位置，与其它事件的相对顺序不变）：
+        血量直接跳到最终值，只播一次受伤/回血特效；被合并掉的事件立即 ACK，后端不必等待。
+
         Args:
             None
 
         Returns:
-            None
+            本帧是否处理了后端事件。
         """
-        while True:
-            try:
-                ev = self._evt_queue.get_nowait()
-            except queue.Empty:
-                break
+        events = communicator.receive_all_from_backend()
+
+        last_hp_change: Dict[int, HPChangeEvent] = {}
+        hp_change_count = 0
+        for ev in events:
+            if type(ev) is HPChangeEvent:
+                last_hp_change[ev.player_id] = ev
+                hp_change_count += 1
+        if hp_change_count > len(last_hp_change):
+            kept: List[Any] = []
+            for ev in events:
+                if type(ev) is HPChangeEvent and last_hp_change[ev.player_id] is not ev:
+                    communicator.send_to_backend(AckEvent.acquire(
+                        original_event_id=ev._event_id, success=True, message="HP change coalesced"))
+                else:
+                    kept.append(ev)
+            events = kept
+
+        for ev in events:
             self._handle_backend_event(ev)
+        return bool(events)
 
     def _handle_backend_event(self, event: Any) -> None:
-        """处理来自后端的事件（动画/状态/输入请求）。
+        """处理来自后端的事件（动画/状态/输入请求）：按事件类型查表分派。
+
+        后端可能在等待每条事件的 ACK：处理方法返回 False（如找不到 PlayerView 而提前返回）、
+        抛出异常或没有对应的处理方法时，在这里补发失败 ACK，避免后端一直等到超时。
 
         Args:
             event: 后端事件对象。
@@ -170,66 +265,79 @@ class GameClient:
         Returns:
             None
         """
-        if event is None:
-            return
-
-        event_id = getattr(event, "_event_id", None)
-        et = type(event).__name__
+        handler = self._event_handlers.get(type(event))
+        ack_owned = False
+        try:
+            if handler is not None:
+                ack_owned = handler(event)
+        finally:
+            if not ack_owned:
+                communicator.send_to_backend(AckEvent.acquire(
+                    original_event_id=event._event_id, success=False, message="Event not handled"))
+
+    def _on_draw_card(self, event: DrawCardEvent) -> bool:
+        """DrawCardEvent -> draw_card_event。"""
+        return self.draw_card_event(_to_card_config(event.card_config), event.to_player, event_id=event._event_id)
+
+    def _on_play_card(self, event: PlayCardEvent) -> bool:
+        """PlayCardEvent -> play_card_event。"""
+        return self.play_card_event(_to_card_config(event.card_config), event.from_player, event.to_player,
+                                    event_id=event._event_id)
+
+    def _on_hp_change(self, event: HPChangeEvent) -> bool:
+        """HPChangeEvent -> change_hp_event。"""
+        return self.change_hp_event(event.player_id, event.new_hp, event_id=event._event_id)
+
+    def _on_discard_card(self, event: DiscardCardEvent) -> bool:
+        """DiscardCardEvent -> discard_card_event。"""
+        return self.discard_card_event(_to_card_config(event.card_config), event.player, event_id=event._event_id)
+
+    def _on_equip_change(self, event: EquipChangeEvent) -> bool:
+        """EquipChangeEvent -> equip_change_event。"""
+        return self.equip_change_event(event.player_id, event.equip_name, event.equip_type, event_id=event._event_id)
+
+    def _on_death(self, event: DeathEvent) -> bool:
+        """DeathEvent -> death_event。"""
+        return self.death_event(event.player_id, event_id=event._event_id)
+
+    def _on_input_request(self, event: InputRequestEvent) -> bool:
+        """InputRequestEvent：进入选择状态，清空上一轮选择缓存。
 
-        if et == "DrawCardEvent":
-            simple_card_cfg = event.card_config
-            card_cfg = CardConfig(card_name=simple_card_cfg.name, suit=simple_card_cfg.suit, rank=simple_card_cfg.rank)
-            self.draw_card_event(card_cfg, event.to_player, event_id=event_id)
-            return
-
-        if et == "PlayCardEvent":
-            simple_card_cfg = event.card_config
-            card_cfg = CardConfig(card_name=simple_card_cfg.name, suit=simple_card_cfg.suit, rank=simple_card_cfg.rank)
-            self.play_card_event(card_cfg, event.from_player, event.to_player, event_id=event_id)
-            return
-
-        if et == "HPChangeEvent":
-            self.change_hp_event(event.player_id, event.new_hp, event_id=event_id)
-            return
+        Args:
+            event: 输入请求事件。
 
-        if et == "DiscardCardEvent":
-            simple_card_cfg = event.card_config
-            card_cfg = CardConfig(card_name=simple_card_cfg.name, suit=simple_card_cfg.suit, rank=simple_card_cfg.rank)
-            self.discard_card_event(card_cfg, event.player, event_id=event_id)
-            return
+        Returns:
+            True：输入请求不需要 ACK，玩家的选择通过 InputResponseEvent 回复。
+        """
+        self.pending_input_request = event
+        self._req_action = getattr(event, "action", "") or ""
+        self._req_prompt = getattr(event, "prompt", "") or ""
+        self._req_options = getattr(event, "options", {}) or {}
+        try:
+            self._req_targets = set(self._req_options.get("targets", []))
+        except TypeError:
+            self._req_targets = set()
+
+        self.selected_target_ids.clear()
+        self.selected_card_index = None
+        self.selected_discard_indices.clear()
 
-        if et == "EquipChangeEvent":
-            self.equip_change_event(event.player_id, event.equip_name, event.equip_type, event_id=event_id)
-            return
+        self._discard_need_count = 0
+        self._discard_min_count = 0
+        self._discard_allow_less = False
 
-        if et == "DeathEvent":
-            self.death_event(event.player_id, event_id=event_id)
-            return
+        try:
+            action = self._req_action
+            options = self._req_options
+            if action == "discard":
+                self._discard_need_count = int(options.get("count", 0) or 0)
+                self._discard_min_count = int(options.get("min_count", self._discard_need_count) or 0)
+                self._discard_allow_less = bool(options.get("allow_less", False))
+        except Exception:
+            pass
 
-        if et == "InputRequestEvent":
-            # 进入选择状态：清空上一轮选择缓存
-            self.pending_input_request = event
-
-            self.selected_target_ids = []
-            self.selected_card_index = None
-            self.selected_discard_indices = []
-
-            self._discard_need_count = 0
-            self._discard_min_count = 0
-            self._discard_allow_less = False
-
-            try:
-                action = getattr(event, "action", "")
-                options = getattr(event, "options", {}) or {}
-                if action == "discard":
-                    self._discard_need_count = int(options.get("count", 0) or 0)
-                    self._discard_min_count = int(options.get("min_count", self._discard_need_count) or 0)
-                    self._discard_allow_less = bool(options.get("allow_less", False))
-            except Exception:
-                pass
-
-            game_state.set_state(GameStateEnum.SELECTING)
-            return
+        game_state.set_state(GameStateEnum.SELECTING)
+        return True
 
     # -------------------------
     # 输入面板：渲染/命中/提交
@@ -244,30 +352,24 @@ class GameClient:
         Returns:
             标题字符串。
         """
-        return {
-            "select_card": "出牌阶段",
-            "select_targets": "选择目标",
-            "discard": "弃牌阶段",
-            "ask_use_card_response": "回合外响应",
-            "ask_activate_skill": "技能询问",
-        }.get(action, "选择")
-
-    def _render_input_panel(self) -> None:
+        return _ACTION_TITLES.get(action, "选择")
+
+    def _render_input_panel(self) -> bool:
         """SELECTING 状态下绘制输入面板，并缓存按钮 rect。
 
         Args:
             None
 
         Returns:
-            None
+            面板内容是否与上一帧不同。
         """
         req = self.pending_input_request
         if req is None:
             self._ui_buttons = {}
-            return
+            return False
 
-        action = getattr(req, "action", "")
-        prompt = getattr(req, "prompt", "") or ""
+        action = self._req_action
+        prompt = self._req_prompt
         title = self._action_title(action)
 
         selected_lines: List[str] = []
@@ -311,6 +413,7 @@ class GameClient:
             confirm_enabled=confirm_enabled,
             cancel_enabled=True,
         )
+        return self.renderer.input_panel_changed
 
     def _submit_input_response(self, payload: dict) -> None:
         """提交 InputResponseEvent 并退出选择态。
@@ -331,11 +434,15 @@ class GameClient:
 
         # 清理选择态
         self.pending_input_request = None
+        self._req_action = ""
+        self._req_prompt = ""
+        self._req_options = {}
+        self._req_targets = set()
         self._ui_buttons = {}
 
-        self.selected_target_ids = []
+        self.selected_target_ids.clear()
         self.selected_card_index = None
-        self.selected_discard_indices = []
+        self.selected_discard_indices.clear()
         self._discard_need_count = 0
         self._discard_min_count = 0
         self._discard_allow_less = False
@@ -354,7 +461,7 @@ class GameClient:
         req = self.pending_input_request
         if req is None:
             return
-        action = getattr(req, "action", "")
+        action = self._req_action
 
         if action in ("select_card", "ask_use_card_response"):
             if self.selected_card_index is None:
@@ -371,7 +478,7 @@ class GameClient:
             return
 
         if action == "discard":
-            self._submit_input_response({"indices": list(self.selected_discard_indices)})
+            self._submit_input_response({"indices": sorted(self.selected_discard_indices)})
             return
 
         if action == "ask_activate_skill":
@@ -395,7 +502,7 @@ class GameClient:
         req = self.pending_input_request
         if req is None:
             return
-        action = getattr(req, "action", "")
+        action = self._req_action
 
         if action == "ask_use_card_response":
             self._submit_input_response({"cancel": True})
@@ -406,9 +513,9 @@ class GameClient:
             return
 
         # 其它动作：只清空选择（让你继续选，不会误结束阶段）
-        self.selected_target_ids = []
+        self.selected_target_ids.clear()
         self.selected_card_index = None
-        self.selected_discard_indices = []
+        self.selected_discard_indices.clear()
 
     def _handle_ui_click(self, pos: tuple[int, int]) -> bool:
         """在 SELECTING 状态下优先处理面板按钮点击。
@@ -452,16 +559,15 @@ class GameClient:
         if req is None:
             return
 
-        action = getattr(req, "action", "")
-        options = getattr(req, "options", {}) or {}
+        action = self._req_action
 
         # 选目标：点角色牌 -> 只选中
         if action == "select_targets":
-            targets = set(options.get("targets", []))
             pid = self.renderer.get_player_at_position(pos)
-            if pid is None or pid not in targets:
+            if pid is None or pid not in self._req_targets:
                 return
-            self.selected_target_ids = [pid]
+            self.selected_target_ids.clear()
+            self.selected_target_ids.append(pid)
             return
 
         # 选牌：点手牌 -> 只选中
@@ -477,9 +583,9 @@ class GameClient:
             if action == "discard":
                 # 多选弃牌：点击切换选中
                 if idx in self.selected_discard_indices:
-                    self.selected_discard_indices.remove(idx)
+                    self.selected_discard_indices.discard(idx)
                 else:
-                    self.selected_discard_indices.append(idx)
+                    self.selected_discard_indices.add(idx)
                 return
 
             self.selected_card_index = idx
@@ -504,14 +610,14 @@ class GameClient:
             None
         """
         player = self._get_player_view(to_player)
-        if player is None:
-            return
-        player.add_card(card_config)
-        player.card_cnt += 1
-        communicator.send_to_backend(AckEvent(original_event_id=event_id, success=True, message="Draw card processed"))
+        if player is not None:
+            player.add_card(card_config)
+            player.card_cnt += 1
+        # 动画回调不经过 _handle_backend_event，玩家视图缺失时也要 ACK
+        communicator.send_to_backend(AckEvent.acquire(original_event_id=event_id, success=True, message="Draw card processed"))
         game_state.set_state(GameStateEnum.WAITING)
 
-    def draw_card_event(self, card_config: CardConfig, to_player: int, event_id: int) -> None:
+    def draw_card_event(self, card_config: CardConfig, to_player: int, event_id: int) -> bool:
         """处理摸牌事件：播放动画。
 
         Args:
@@ -520,20 +626,21 @@ class GameClient:
             event_id: 事件 ID。
 
         Returns:
-            None
+            bool: 是否已发出 ACK 或已交给动画结束回调发出；False 时由 _handle_backend_event 补发。
         """
         player = self._get_player_view(to_player)
         if player is None:
-            return
+            return False
+        # 自己摸牌飞向手牌区，他人飞向角色牌；只有自己的 PlayerView 有手牌区坐标
         to_pos = player.card_center_pos if player.is_self else player.character_pos
         face_up = player.is_self
-        if to_pos != (None, None):
-            self.animation_mgr.add_draw_card_animation(
-                card_config,
-                to_pos,
-                face_up,
-                on_complete=lambda: self.after_draw_card(card_config, to_player, event_id)
-            )
+        self.animation_mgr.add_draw_card_animation(
+            card_config,
+            to_pos,
+            face_up,
+            on_complete=partial(self.after_draw_card, card_config, to_player, event_id)
+        )
+        return True
 
     def set_waiting_and_ack(self, event_id: int) -> None:
         """通用：ACK 并回到 WAITING。
@@ -544,7 +651,7 @@ class GameClient:
         Returns:
             None
         """
-        communicator.send_to_backend(AckEvent(original_event_id=event_id, success=True, message="Event processed"))
+        communicator.send_to_backend(AckEvent.acquire(original_event_id=event_id, success=True, message="Event processed"))
         game_state.set_state(GameStateEnum.WAITING)
 
     def after_play_card(self, card_config: CardConfig, from_player: int, to_player: int, event_id: int) -> None:
@@ -559,37 +666,27 @@ class GameClient:
         Returns:
             None
         """
-        from_pv = self._get_player_view(from_player)
-        if from_pv is None:
-            return
         center_pos = self.renderer.screen_center
+        anim = self.animation_mgr
 
         if to_player == -1:
-            self.animation_mgr.add_show_card(
+            anim.add_show_card(
                 card_config, center_pos, duration_frames=60,
-                on_complete=lambda: self.set_waiting_and_ack(event_id=event_id)
+                on_complete=partial(self.set_waiting_and_ack, event_id)
             )
             return
 
+        # 目标视图缺失时只跳过命中特效，仍展示这张牌并 ACK
         to_pv = self._get_player_view(to_player)
-        if to_pv is None:
-            return
-
-        if card_config.name == CardName.SHA:
-            self.animation_mgr.add_effect(EffectName.HURT, to_pv.character_pos, duration_frames=60,
-                                          on_complete=lambda: game_state.set_state(GameStateEnum.WAITING))
-            self.animation_mgr.add_show_card(card_config, center_pos, duration_frames=60,
-                                             on_complete=lambda: self.set_waiting_and_ack(event_id=event_id))
-        elif card_config.name == CardName.JUE_DOU:
-            self.animation_mgr.add_effect(EffectName.BOOM, to_pv.character_pos, duration_frames=60,
-                                          on_complete=lambda: game_state.set_state(GameStateEnum.WAITING))
-            self.animation_mgr.add_show_card(card_config, center_pos, duration_frames=60,
-                                             on_complete=lambda: self.set_waiting_and_ack(event_id=event_id))
-        else:
-            self.animation_mgr.add_show_card(card_config, center_pos, duration_frames=60,
-                                             on_complete=lambda: self.set_waiting_and_ack(event_id=event_id))
-
-    def play_card_event(self, card: CardConfig, from_player: int, to_player: int, event_id: int) -> None:
+        effect = _CARD_HIT_EFFECTS.get(card_config.name)
+        if effect is not None and to_pv is not None:
+            anim.add_effect(effect, to_pv.character_pos, duration_frames=60,
+                            on_complete=partial(game_state.set_state, GameStateEnum.WAITING))
+        # 无论是否有命中特效，都在中央展示这张牌，展示结束后 ACK
+        anim.add_show_card(card_config, center_pos, duration_frames=60,
+                           on_complete=partial(self.set_waiting_and_ack, event_id))
+
+    def play_card_event(self, card: CardConfig, from_player: int, to_player: int, event_id: int) -> bool:
         """处理出牌事件：播放移动动画。
 
         Args:
@@ -599,11 +696,11 @@ class GameClient:
             event_id: 事件 ID。
 
         Returns:
-            None
+            bool: 是否已发出 ACK 或已交给动画结束回调发出；False 时由 _handle_backend_event 补发。
         """
         from_pv = self._get_player_view(from_player)
         if from_pv is None:
-            return
+            return False
         from_pv.card_cnt -= 1
 
         to_pos = self.renderer.screen_center
@@ -613,13 +710,13 @@ class GameClient:
         else:
             from_pos = from_pv.character_pos
 
-        if to_pos != (None, None):
-            self.animation_mgr.add_play_card_animation(
-                card, from_pos, to_pos,
-                on_complete=lambda: self.after_play_card(card, from_player, to_player, event_id=event_id)
-            )
+        self.animation_mgr.add_play_card_animation(
+            card, from_pos, to_pos,
+            on_complete=partial(self.after_play_card, card, from_player, to_player, event_id)
+        )
+        return True
 
-    def change_hp_event(self, player_id: int, new_hp: int, event_id: int) -> None:
+    def change_hp_event(self, player_id: int, new_hp: int, event_id: int) -> bool:
         """处理血量变化事件。
 
         Args:
@@ -628,20 +725,22 @@ class GameClient:
             event_id: 事件 ID。
 
         Returns:
-            None
+            bool: 是否已发出 ACK 或已交给动画结束回调发出；False 时由 _handle_backend_event 补发。
         """
         player = self._get_player_view(player_id)
         if player is None:
-            return
+            return False
         old_hp = player.get_hp()
         player.update_hp(new_hp)
 
-        if new_hp < old_hp:
-            self.animation_mgr.add_effect(EffectName.DAMAGE, player.character_pos, duration_frames=60,
-                                          on_complete=lambda: self.set_waiting_and_ack(event_id=event_id))
-        elif new_hp > old_hp:
-            self.animation_mgr.add_effect(EffectName.HEAL, player.character_pos, duration_frames=60,
-                                          on_complete=lambda: self.set_waiting_and_ack(event_id=event_id))
+        if new_hp != old_hp:
+            effect = EffectName.DAMAGE if new_hp < old_hp else EffectName.HEAL
+            self.animation_mgr.add_effect(effect, player.character_pos, duration_frames=60,
+                                          on_complete=partial(self.set_waiting_and_ack, event_id))
+        else:
+            # 血量没变（例如合并后的净变化为 0）：没有特效可播，直接 ACK
+            communicator.send_to_backend(AckEvent.acquire(original_event_id=event_id, success=True, message="HP unchanged"))
+        return True
 
     def after_discard_card(self, card_config: CardConfig, event_id: int) -> None:
         """弃牌动画结束回调：show 并 ACK。
@@ -656,10 +755,10 @@ class GameClient:
         center_pos = self.renderer.deck_center_pos
         self.animation_mgr.add_show_card(
             card_config, center_pos, duration_frames=60,
-            on_complete=lambda: self.set_waiting_and_ack(event_id=event_id)
+            on_complete=partial(self.set_waiting_and_ack, event_id)
         )
 
-    def discard_card_event(self, card: CardConfig, player_id: int, event_id: int) -> None:
+    def discard_card_event(self, card: CardConfig, player_id: int, event_id: int) -> bool:
         """处理弃牌事件。
 
         Args:
@@ -668,26 +767,27 @@ class GameClient:
             event_id: 事件 ID。
 
         Returns:
-            None
+            bool: 是否已发出 ACK 或已交给动画结束回调发出；False 时由 _handle_backend_event 补发。
         """
         player = self._get_player_view(player_id)
         if player is None:
-            return
+            return False
 
-        if not (card.name.value in EquipmentName._value2member_map_):
+        is_self = player.is_self
+        if card.name.value not in _EQUIPMENT_VALUES:
             player.card_cnt -= 1
-        if player.is_self:
+        if is_self:
             player.remove_card(card)
 
-        from_pos = player.character_pos if not player.is_self else player.card_center_pos
+        from_pos = player.card_center_pos if is_self else player.character_pos
         to_pos = self.renderer.deck_center_pos
-        if to_pos != (None, None):
-            self.animation_mgr.add_discard_card_animation(
-                card, from_pos, to_pos,
-                on_complete=lambda: self.after_discard_card(card, event_id=event_id)
-            )
+        self.animation_mgr.add_discard_card_animation(
+            card, from_pos, to_pos,
+            on_complete=partial(self.after_discard_card, card, event_id)
+        )
+        return True
 
-    def equip_change_event(self, player_id: int, equip_name: CardName, equip_type: EquipmentType, event_id: int) -> None:
+    def equip_change_event(self, player_id: int, equip_name: CardName, equip_type: EquipmentType, event_id: int) -> bool:
         """处理装备变化事件。
 
         Args:
@@ -697,16 +797,17 @@ class GameClient:
             event_id: 事件 ID。
 
         Returns:
-            None
+            bool: 是否已发出 ACK 或已交给动画结束回调发出；False 时由 _handle_backend_event 补发。
         """
         player = self._get_player_view(player_id)
         if player is None:
-            return
+            return False
         player.equipment[equip_type] = equip_name
         game_state.set_state(GameStateEnum.WAITING)
-        communicator.send_to_backend(AckEvent(original_event_id=event_id, success=True, message="Equip change processed"))
+        communicator.send_to_backend(AckEvent.acquire(original_event_id=event_id, success=True, message="Equip change processed"))
+        return True
 
-    def death_event(self, player_id: int, event_id: int) -> None:
+    def death_event(self, player_id: int, event_id: int) -> bool:
         """处理死亡事件。
 
         Args:
@@ -714,19 +815,32 @@ class GameClient:
             event_id: 事件 ID。
 
         Returns:
-            None
+            bool: 是否已发出 ACK 或已交给动画结束回调发出；False 时由 _handle_backend_event 补发。
         """
         player = self._get_player_view(player_id)
         if player is None:
-            return
+            return False
         player.dead = True
         game_state.set_state(GameStateEnum.WAITING)
-        communicator.send_to_backend(AckEvent(original_event_id=event_id, success=True, message="Death event processed"))
+        communicator.send_to_backend(AckEvent.acquire(original_event_id=event_id, success=True, message="Death event processed"))
+        return True
 
     # -------------------------
     # 主循环
     # -------------------------
 
+    def _apply_resize(self, size: tuple[int, int]) -> None:
+        """按新窗口尺寸重建显示 Surface，并通知 Renderer 重新布局。
+
+        Args:
+            size: 新窗口尺寸 (w, h)。
+
+        Returns:
+            None
+        """
+        self.screen = pygame.display.set_mode(size, pygame.RESIZABLE)
+        self.renderer.handle_resize(self.screen)
+
     def run(self) -> None:
         """运行主循环。
 
@@ -739,25 +853,76 @@ class GameClient:
         running = True
         game_state.set_state(GameStateEnum.WAITING)
 
-        # 启动后端事件接收线程
-        if self._recv_thread is None:
-            self._recv_thread = threading.Thread(target=self._recv_loop, daemon=True)
-            self._recv_thread.start()
+        # 只让主循环实际处理的事件进入 SDL 队列；其余（尤其是高频的 MOUSEMOTION）在 SDL 层直接丢弃，
+        # 不再为它们创建 Python 事件对象
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.VIDEORESIZE, pygame.VIDEOEXPOSE, pygame.MOUSEBUTTONDOWN,
+                                  pygame.KEYDOWN, _BACKEND_WAKEUP_EVENT])
+        # 后端发来事件时立即唤醒空闲等待中的主循环，而不是靠超时轮询
+        communicator.set_backend_listener(self._wake_main_loop)
+
+        # 主循环每帧都要用到的方法/对象先绑定为局部变量，省去循环内的属性查找
+        drain_backend_events = self._drain_backend_events
+        get_events = pygame.event.get
+        wait_event = pygame.event.wait
+        has_animations = self.animation_mgr.has_active
+        has_backend_events = communicator.has_backend_events
+        selecting_key_handlers = self._selecting_key_handlers
+        action_key_handlers = self._action_key_handlers
+        update_animations = self.animation_mgr.update
+        draw = self.renderer.draw
+        render_input_panel = self._render_input_panel
+        flip = pygame.display.flip
+        update_display = pygame.display.update
+        tick = self.clock.tick
+        state = game_state
+        SELECTING = GameStateEnum.SELECTING
+        WAITING = GameStateEnum.WAITING
+        # 场景（面板以外的部分）自上次整屏绘制后是否可能变化：后端事件、窗口缩放/重新露出、动画都会改变场景。
+        # 初始为 True：第一帧必须绘制，之后才允许进入空闲等待
+        scene_dirty = True
+        # 上一次呈现的画面里是否有输入面板（面板撤下时需要整屏重绘一次）
+        panel_visible = False
 
         while running:
+            # 0) 空闲（等待后端、无动画、无待处理事件）时画面不会变化：
+            #    阻塞等待 pygame 事件（后端来事件时会收到唤醒事件），超时后若后端仍无新事件则跳过本帧，不重绘
+            if not scene_dirty and state.state is WAITING and not has_backend_events() and not has_animations():
+                first = wait_event(_IDLE_WAIT_MS)
+                if first.type != pygame.NOEVENT:
+                    events = [first]
+                    events.extend(get_events())
+                elif has_backend_events():
+                    events = []
+                else:
+                    continue
+            else:
+                events = get_events()
+
             # 1) 每帧都处理后端事件（关键：动画/选择阶段也不漏）
-            self._drain_backend_events()
+            if drain_backend_events():
+                scene_dirty = True
 
             # 2) 处理 pygame 输入
-            for ev in pygame.event.get():
+            # 拖动窗口时一帧内会有多个 VIDEORESIZE：只记下最后的尺寸，统一 set_mode 一次
+            pending_size = None
+            for ev in events:
                 if ev.type == pygame.QUIT:
                     running = False
 
                 elif ev.type == pygame.VIDEORESIZE:
-                    self.screen = pygame.display.set_mode((ev.w, ev.h), pygame.RESIZABLE)
-                    self.renderer.handle_resize(self.screen)
-
-                elif ev.type == pygame.MOUSEBUTTONDOWN and game_state.state == GameStateEnum.SELECTING:
+                    pending_size = (ev.w, ev.h)
+
+                elif ev.type == pygame.VIDEOEXPOSE:
+                    # 窗口被遮挡/最小化后重新露出：按需重绘的画面需要重新呈现
+                    scene_dirty = True
+
+                elif ev.type == pygame.MOUSEBUTTONDOWN and state.state is SELECTING:
+                    # 点击坐标基于新窗口：命中测试前先应用尚未生效的缩放
+                    if pending_size is not None:
+                        self._apply_resize(pending_size)
+                        pending_size = None
+                        scene_dirty = True
                     # 先处理 UI 面板按钮命中（确认/取消）
                     if self._handle_ui_click(ev.pos):
                         continue
@@ -765,40 +930,44 @@ class GameClient:
                     if ev.button == 1:
                         self._handle_selecting_click(ev.pos)
 
-                elif ev.type == pygame.KEYDOWN and game_state.state == GameStateEnum.SELECTING:
-                    req = self.pending_input_request
-                    action = getattr(req, "action", "") if req else ""
-
-                    # ESC：按 action 区分语义（响应/技能：直接否决；其它：清空选择）
-                    if ev.key == pygame.K_ESCAPE:
-                        self._handle_cancel()
-
-                    # 回车：等价于点击“确认”
-                    elif ev.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
-                        self._submit_confirm()
+                elif ev.type == pygame.KEYDOWN and state.state is SELECTING:
+                    # 快捷键查表（见 __init__ 中的 _selecting_key_handlers / _action_key_handlers）
+                    handler = selecting_key_handlers.get(ev.key)
+                    if handler is None and self.pending_input_request is not None:
+                        handler = action_key_handlers.get(self._req_action, {}).get(ev.key)
+                    if handler is not None:
+                        handler()
 
-                    # Y/N：技能询问快捷键
-                    elif action == "ask_activate_skill" and ev.key in (pygame.K_y, pygame.K_n):
-                        self._submit_input_response({"activate": ev.key == pygame.K_y})
+            if pending_size is not None:
+                self._apply_resize(pending_size)
+                scene_dirty = True
 
-                    # 退格：清空弃牌选择
-                    elif action == "discard" and ev.key == pygame.K_BACKSPACE:
-                        self.selected_discard_indices = []
-
-            # 3) 动画更新
-            self.animation_mgr.update()
+            # 3) 动画更新（本帧有动画时场景必然变化，包括动画在本帧结束、精灵被移除的情况）
+            if has_animations():
+                scene_dirty = True
+                update_animations()
 
             # 4) 渲染：SELECTING 时额外绘制输入面板（并保证 flip 时机正确）
-            if game_state.state == GameStateEnum.SELECTING and self.pending_input_request is not None:
-                # Renderer.draw 需要支持 do_flip=False
-                self.renderer.draw(do_flip=False)
-                self._render_input_panel()
-                pygame.display.flip()
-            else:
-                self.renderer.draw()
-
-            self.clock.tick(30)
+            if state.state is SELECTING and self.pending_input_request is not None:
+                if scene_dirty:
+                    # Renderer.draw 需要支持 do_flip=False
+                    draw(do_flip=False)
+                    render_input_panel()
+                    flip()
+                elif render_input_panel():
+                    # 场景未变、只有面板内容变了：只把面板区域刷到屏幕上，不整屏 flip。
+                    # 面板的圆角外完全透明、其余不透明，直接覆盖旧面板即可
+                    update_display(self._ui_buttons["panel"])
+                # 两者都没变：屏幕上已是当前画面，本帧不绘制
+                panel_visible = True
+            elif scene_dirty or panel_visible:
+                # 非选择状态只在场景变化或刚撤下输入面板时重绘
+                draw()
+                panel_visible = False
+            scene_dirty = False
+
+            tick(30)
 
         # 退出清理
-        self._stop_event.set()
+        communicator.set_backend_listener(None)
         pygame.quit()
@@ -18,6 +18,7 @@ class Renderer:
         self.bg = pygame.Surface(self.screen.get_size())
         self.bg.fill(default_colors["greybrown"])
         self.asset_mgr = AssetManager()
+        self.asset_mgr.prewarm(config)
         self.all_sprites = pygame.sprite.LayeredDirty()
         # Initialize card sprites in deck:
         self.deck_center_pos = self._get_deck_center_pos()
@@ -26,6 +27,11 @@ class Renderer:
         pygame.font.init()
         self.ui_font = pygame.font.SysFont("Microsoft YaHei", 20)
         self.ui_font_small = pygame.font.SysFont("Microsoft YaHei", 16)
+        # 输入面板缓存：(绘制参数) -> (面板 Surface, 按钮 Rect)，见 draw_input_panel
+        self._input_panel_key: Optional[tuple] = None
+        self._input_panel_cache: Optional[Tuple[pygame.Surface, Dict[str, pygame.Rect]]] = None
+        # 最近一次 draw_input_panel 是否重新渲染了面板（内容与上次不同）
+        self.input_panel_changed: bool = False
 
 
         # Initialize player view:
@@ -76,6 +82,7 @@ class Renderer:
         pos: tuple[int, int],
         font: Optional[pygame.font.Font] = None,
         color: tuple[int, int, int] = (255, 255, 255),
+        surface: Optional[pygame.Surface] = None,
     ) -> pygame.Rect:
         """绘制文本并返回其矩形区域。
 
@@ -84,38 +91,45 @@ class Renderer:
             pos: 左上角坐标 (x, y)。
             font: 字体对象。
             color: 文本颜色。
+            surface: 绘制目标，默认为屏幕。
 
         Returns:
             文本 Rect。
         """
         if font is None:
             font = self.ui_font
+        if surface is None:
+            surface = self.screen
         surf = font.render(text, True, color)
         rect = surf.get_rect(topleft=pos)
-        self.screen.blit(surf, rect)
+        surface.blit(surf, rect)
         return rect
 
-    def draw_button(self, rect: pygame.Rect, label: str, enabled: bool = True) -> None:
+    def draw_button(self, rect: pygame.Rect, label: str, enabled: bool = True,
+                    surface: Optional[pygame.Surface] = None) -> None:
         """绘制按钮（最小实现：矩形+边框+文字）。
 
         Args:
             rect: 按钮区域。
             label: 按钮文本。
             enabled: 是否可用。
+            surface: 绘制目标，默认为屏幕。
 
         Returns:
             None
         """
+        if surface is None:
+            surface = self.screen
         bg = (60, 60, 60) if enabled else (35, 35, 35)
         border = (200, 200, 200) if enabled else (120, 120, 120)
 
-        pygame.draw.rect(self.screen, bg, rect, border_radius=10)
-        pygame.draw.rect(self.screen, border, rect, width=2, border_radius=10)
+        pygame.draw.rect(surface, bg, rect, border_radius=10)
+        pygame.draw.rect(surface, border, rect, width=2, border_radius=10)
 
         font = self.ui_font
         text_surf = font.render(label, True, (255, 255, 255) if enabled else (180, 180, 180))
         text_rect = text_surf.get_rect(center=rect.center)
-        self.screen.blit(text_surf, text_rect)
+        surface.blit(text_surf, text_rect)
 
     def draw_input_panel(
         self,
@@ -137,41 +151,74 @@ class Renderer:
         Returns:
             {"confirm": confirm_rect, "cancel": cancel_rect, "panel": panel_rect}
         """
+        # 面板内容不变时直接贴上次渲染好的面板图，省去逐帧的文字排版与图形绘制
+        key = (title, prompt, tuple(selected_lines), confirm_enabled, cancel_enabled, self.screen.get_size())
+        self.input_panel_changed = key != self._input_panel_key
+        if self.input_panel_changed:
+            self._input_panel_key = key
+            self._input_panel_cache = self._render_input_panel(
+                title, prompt, selected_lines, confirm_enabled, cancel_enabled
+            )
+        panel_surf, buttons = self._input_panel_cache
+        self.screen.blit(panel_surf, buttons["panel"])
+        return buttons
+
+    def _render_input_panel(
+        self,
+        title: str,
+        prompt: str,
+        selected_lines: List[str],
+        confirm_enabled: bool,
+        cancel_enabled: bool,
+    ) -> Tuple[pygame.Surface, Dict[str, pygame.Rect]]:
+        """把输入面板画到一张独立的透明 Surface 上（参数同 draw_input_panel）。
+
+        Returns:
+            (面板 Surface, 屏幕坐标下的按钮 Rect 字典)
+        """
         w, h = self.screen.get_size()
         panel_w = int(w * 0.46)
         panel_h = int(h * 0.23)
         panel_x = (w - panel_w) // 2
         panel_y = (h - panel_h) // 2
         panel_rect = pygame.Rect(panel_x, panel_y, panel_w, panel_h)
+        # 面板内使用局部坐标绘制；圆角外透明
+        surf = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+        local_rect = surf.get_rect()
 
         # 背景与边框
-        pygame.draw.rect(self.screen, (18, 18, 18), panel_rect, border_radius=14)
-        pygame.draw.rect(self.screen, (120, 120, 120), panel_rect, width=2, border_radius=14)
+        pygame.draw.rect(surf, (18, 18, 18), local_rect, border_radius=14)
+        pygame.draw.rect(surf, (120, 120, 120), local_rect, width=2, border_radius=14)
 
         # 标题
-        self.draw_text(f"[{title}]", (panel_x + 14, panel_y + 10), font=self.ui_font, color=(255, 220, 140))
+        self.draw_text(f"[{title}]", (14, 10), font=self.ui_font, color=(255, 220, 140), surface=surf)
 
         # prompt（太长就截断到两行的感觉）
         p = (prompt or "").replace("\n", " ")
         if len(p) > 90:
             p = p[:90] + "..."
-        self.draw_text(p, (panel_x + 14, panel_y + 44), font=self.ui_font_small, color=(230, 230, 230))
+        self.draw_text(p, (14, 44), font=self.ui_font_small, color=(230, 230, 230), surface=surf)
 
         # 已选信息（最多显示 4 行）
-        y0 = panel_y + 72
+        y0 = 72
         for i, line in enumerate(selected_lines[:4]):
-            self.draw_text(f"- {line}", (panel_x + 14, y0 + i * 18), font=self.ui_font_small, color=(200, 200, 200))
+            self.draw_text(f"- {line}", (14, y0 + i * 18), font=self.ui_font_small, color=(200, 200, 200),
+                           surface=surf)
 
         # 按钮区域
         btn_w, btn_h = 120, 38
         gap = 12
-        cancel_rect = pygame.Rect(panel_x + panel_w - btn_w * 2 - gap - 14, panel_y + panel_h - btn_h - 12, btn_w, btn_h)
-        confirm_rect = pygame.Rect(panel_x + panel_w - btn_w - 14, panel_y + panel_h - btn_h - 12, btn_w, btn_h)
+        cancel_rect = pygame.Rect(panel_w - btn_w * 2 - gap - 14, panel_h - btn_h - 12, btn_w, btn_h)
+        confirm_rect = pygame.Rect(panel_w - btn_w - 14, panel_h - btn_h - 12, btn_w, btn_h)
 
-        self.draw_button(cancel_rect, "取消", enabled=cancel_enabled)
-        self.draw_button(confirm_rect, "确认", enabled=confirm_enabled)
+        self.draw_button(cancel_rect, "取消", enabled=cancel_enabled, surface=surf)
+        self.draw_button(confirm_rect, "确认", enabled=confirm_enabled, surface=surf)
 
-        return {"confirm": confirm_rect, "cancel": cancel_rect, "panel": panel_rect}
+        return surf, {
+            "confirm": confirm_rect.move(panel_x, panel_y),
+            "cancel": cancel_rect.move(panel_x, panel_y),
+            "panel": panel_rect,
+        }
 
 
     def get_player_at_position(self, pos: tuple[int, int]) -> Optional[int]:
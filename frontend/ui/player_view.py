@@ -41,18 +41,14 @@ class PlayerView:
         if not self.is_self or not self.cards:
             return None
 
-        # 有 click_rects 就用它（解决重叠遮挡）
-        if getattr(self, "hand_click_rects", None) and len(self.hand_click_rects) == len(self.cards):
-            for i in range(len(self.cards) - 1, -1, -1):
-                if self.hand_click_rects[i].collidepoint(pos):
-                    return i
-            return None
-
-        # 兜底：没有 click_rects 就用整张 rect
-        for i in range(len(self.cards) - 1, -1, -1):
-            if self.cards[i].rect.collidepoint(pos):
-                return i
-        return None
+        # 有 click_rects 就用它（解决重叠遮挡）；兜底：没有 click_rects 就用整张 rect
+        rects = self.hand_click_rects
+        if len(rects) != len(self.cards):
+            rects = [card.rect for card in self.cards]
+
+        # collidelistall 在 C 层一次测完所有牌（1x1 的 Rect 与点命中等价）；后画的牌在上层，取最后一个命中
+        hits = pygame.Rect(pos, (1, 1)).collidelistall(rects)
+        return hits[-1] if hits else None
 
     def _get_character_pos(self):
         # 根据 player_id 和 is_self 计算位置